@@ -63,7 +63,7 @@ def cut_mesh(m1, m2, prec=None) -> '(Mesh, Web)':
 	
 	# topology informations for optimization
 	points = hashing.PointSet(prec, manage=m1.points)
-	prox2 = hashing.PositionMap(hashing.meshcellsize(m2))
+	prox2 = hashing.PositionMap(hashing.meshcellsize(m2), dtype='i')
 	for f2 in range(len(m2.faces)):
 		prox2.add(m2.facepoints(f2), f2)
 	conn = connef(m1.faces)
@@ -261,7 +261,7 @@ def cut_web(w1: Web, ref: Web, prec=None) -> '(Web, Wire)':
 	
 	# topology informations for optimization
 	points = hashing.PointSet(prec, manage=w1.points)
-	prox = hashing.PositionMap(hashing.meshcellsize(ref))
+	prox = hashing.PositionMap(hashing.meshcellsize(ref), dtype='i')
 	for e in range(len(ref.edges)):
 		prox.add(ref.edgepoints(e), e)
 	conn = connpe(w1.edges)
@@ -421,7 +421,7 @@ def cut_web_mesh(w1: Web, ref: Mesh, prec=None) -> '(Web, Wire)':
 	
 	# topology informations for optimization
 	points = hashing.PointSet(prec, manage=w1.points)
-	prox = hashing.PositionMap(hashing.meshcellsize(ref))
+	prox = hashing.PositionMap(hashing.meshcellsize(ref), dtype='i')
 	for f in range(len(ref.faces)):
 		prox.add(ref.facepoints(f), f)
 	conn = connpe(w1.edges)
@@ -2,21 +2,14 @@
 
 # cython: language_level=3, cdivision=True
 
-from libc.math cimport fabs, ceil, floor, sqrt, fmod, INFINITY
+from libc.math cimport fabs, ceil, floor, sqrt, INFINITY
+from libc.stdlib cimport labs
 cimport cython
 import glm
 
 cdef:
 	DEF NUMPREC = 1e-13
 	
-	double pmod(double l, double r):
-		''' proceed to a python-like modulo on floats 
-			(C module doesn't give a good reminder for negative values) 
-		'''
-		m = fmod(l,r)
-		if m < 0:	m += r
-		return m
-	
 	struct cvec3:
 		double x
 		double y
@@ -43,12 +36,12 @@ cdef:
 		for i in range(1,l):
 			if v[i] < m:	m = v[i]
 		return m
-	double aimax(double *v, size_t l):
+	size_t aimax(double *v, size_t l):
 		j = 0
 		for i in range(1,l):
 			if v[i] > v[j]:	j = i
 		return j
-	double aimin(double *v, size_t l):
+	size_t aimin(double *v, size_t l):
 		j = 0
 		for i in range(1,l):
 			if v[i] < v[j]:	j = i
@@ -78,12 +71,8 @@ cdef:
 					b.z + a.z*x)
 
 cdef cvec3 glm2c(v):
-	cdef cvec3 r
-	cdef size_t i
 	assert isinstance(v, (glm.dvec3, glm.fvec3, glm.ivec3))
-	cdef double[:] a = v
-	for i in range(3):	varr(&r)[i] = a[i]
-	return r
+	return cvec3(v.x, v.y, v.z)
 
 cdef object c2glm(cvec3 v):
 	return glm.dvec3(v.x, v.y, v.z)
@@ -95,75 +84,108 @@ cdef int dsign(double v):
 	
 
 	
+cdef double ylerp(cvec3 p, cvec3 q, double x):
+	''' y coordinate at abscissa x on the line from p to q '''
+	if q.x == p.x:	return p.y
+	return p.y + (q.y-p.y) * (x-p.x) / (q.x-p.x)
+	
 cdef long key(double f, double cell):
 	''' hashing key for a float '''
 	return <long> floor(f/cell)
 	
+cdef double cellfloor(double f, double cell):
+	''' lower border of the cell containing f, consistent with `key` '''
+	return cell * floor(f/cell)
+	
+cdef unsigned long long pack(long x, long y, long z):
+	''' hashing key for a cell, the cell coordinates are packed on 21 bits each in one integer
+		(cells further than 2**20 apart alias to the same key)
+	'''
+	return (<unsigned long long>x & 0x1fffff) << 42 | (<unsigned long long>y & 0x1fffff) << 21 | (<unsigned long long>z & 0x1fffff)
+	
 def rasterize_segment(spaceo, double cell):
-	''' return a list of hashing keys for an edge '''
-	cdef cvec3 n, v, o
-	cdef size_t order[3]
-	cdef size_t reorder[3]
-	cdef size_t i,j,k
-	cdef double x,y,z, xmin,ymin, zmin,zmax
-	cdef long pk[3]
-	cdef cvec3 space[2]
-	cdef double prec
+	''' return a list of hashing keys for an edge 
+	
+		the edge is traversed cell by cell (Amanatides & Woo voxel traversal), a cell's neighbors are also keyed when the edge passes closer than the numeric precision to their common border
+	'''
+	cdef cvec3 a, b, v
+	cdef long k[3]
+	cdef long last[3]
+	cdef long step[3]
+	cdef double tmax[3]
+	cdef double tdelta[3]
+	cdef long cand[3][3]
+	cdef size_t ncand[3]
+	cdef size_t i, axis, enter, s, n, ix,iy,iz
+	cdef double d, prec, t0, t1, c0, c1
+	cdef bint dilated
 	
 	if cell <= 0:	raise ValueError('cell must be strictly positive')
 	
-	space = [glm2c(spaceo[0]), glm2c(spaceo[1])]
+	a, b = glm2c(spaceo[0]), glm2c(spaceo[1])
 	rasterization = []
-	prec = NUMPREC * max(norminf(space[0]), norminf(space[1]))
+	prec = NUMPREC * max(norminf(a), norminf(b))
+	v = vsub(b, a)
+	if norminf(v) < prec:	return rasterization
 	
-	# permutation of coordinates to get the direction the closest to Z
-	n = vabs(vsub(space[1], space[0]))
-	if vmax(n) < prec:	return rasterization
-	if   n.y >= n.x and n.y >= n.z:		order,reorder = [2,0,1],[1,2,0]
-	elif n.x >= n.y and n.x >= n.z:		order,reorder = [1,2,0],[2,0,1]
-	else:								order,reorder = [0,1,2],[0,1,2]
-	for i in range(2):
-		temp = space[i]
-		for j in range(3):
-			varr(&space[i])[j] = varr(&temp)[order[j]]
-	
-	# prepare variables
-	v = vsub(space[1], space[0])
-	cell2 = cell/2
-	assert v.z, order
-	dy = v.y/v.z
-	dx = v.x/v.z
-	o = space[0]
-	
-	# z selection
-	zmin,zmax = space[0].z, space[1].z
-	if v.z < 0:		zmin,zmax = zmax,zmin
-	zmin -= prec
-	zmax += prec
-	zmin -= pmod(zmin,cell)
-	for i in range(max(1,<size_t>ceil((zmax-zmin)/cell))):
-		z = zmin + cell*i + cell2
+	# traversal parameters, the edge is parametrized by t in [0,1]
+	n = 0
+	for i in range(3):
+		d = varr(&v)[i]
+		k[i] = key(varr(&a)[i], cell)
+		last[i] = key(varr(&b)[i], cell)
+		if d > 0:
+			step[i] = 1
+			tdelta[i] = cell/d
+			tmax[i] = ((k[i]+1)*cell - varr(&a)[i]) / d
+		elif d < 0:
+			step[i] = -1
+			tdelta[i] = -cell/d
+			tmax[i] = (k[i]*cell - varr(&a)[i]) / d
+		else:
+			step[i] = 0
+			tdelta[i] = INFINITY
+		# an axis is not stepped anymore once its last cell is reached
+		if k[i] == last[i]:		tmax[i] = INFINITY
+		n += labs(last[i] - k[i])
+	
+	dilated = False
+	enter = 3
+	t0 = 0
+	for s in range(n+1):
+		# closest border among the 3 axis
+		axis = 0 if tmax[0] <= tmax[1] and tmax[0] <= tmax[2] else (1 if tmax[1] <= tmax[2] else 2)
+		t1 = min(tmax[axis], 1.)
+		if s == n:	axis = 3
 		
-		# y selection
-		ymin,ymax = o.y + dx*(z-cell2-o.z),  o.y + dx*(z+cell2-o.z)
-		if dy < 0:	ymin,ymax = ymax,ymin
-		ymin -= prec
-		ymax += prec
-		ymin -= pmod(ymin,cell)
-		for j in range(max(1,<size_t>ceil((ymax-ymin)/cell))):
-			y = ymin + j*cell + cell2
-			
-			# x selection
-			xmin,xmax = o.x + dx*(z-cell2-o.z),  o.x + dx*(z+cell2-o.z)
-			if dx < 0:	xmin,xmax = xmax,xmin	
-			xmin -= prec
-			xmax += prec
-			xmin -= pmod(xmin,cell)
-			for k in range(max(1,<size_t>ceil((xmax-xmin)/cell))):
-				x = xmin + k*cell + cell2
-				
-				pk = [key(x,cell), key(y,cell), key(z,cell)]
-				rasterization.append(( pk[reorder[0]], pk[reorder[1]], pk[reorder[2]] ))
+		# neighbors whose border is touched by the portion of edge in the current cell
+		for i in range(3):
+			cand[i][0] = k[i]
+			ncand[i] = 1
+			c0 = varr(&a)[i] + varr(&v)[i]*t0
+			c1 = varr(&a)[i] + varr(&v)[i]*t1
+			if min(c0,c1) - k[i]*cell <= prec and not (step[i] < 0 and i == axis or step[i] > 0 and i == enter):
+				cand[i][ncand[i]] = k[i]-1
+				ncand[i] += 1
+			if (k[i]+1)*cell - max(c0,c1) <= prec and not (step[i] > 0 and i == axis or step[i] < 0 and i == enter):
+				cand[i][ncand[i]] = k[i]+1
+				ncand[i] += 1
+			if ncand[i] > 1:	dilated = True
+		for ix in range(ncand[0]):
+			for iy in range(ncand[1]):
+				for iz in range(ncand[2]):
+					rasterization.append(pack(cand[0][ix], cand[1][iy], cand[2][iz]))
+		
+		# step to the next cell through the closest cell border
+		if axis < 3:
+			k[axis] += step[axis]
+			tmax[axis] += tdelta[axis]
+			if k[axis] == last[axis]:	tmax[axis] = INFINITY
+		enter = axis
+		t0 = t1
+	
+	if dilated:	
+		rasterization = list(set(rasterization))
 	return rasterization
 
 
@@ -173,10 +195,11 @@ def rasterize_triangle(spaceo, double cell):
 	cdef size_t order[3]
 	cdef size_t reorder[3]
 	cdef cvec3 v[3]
-	cdef double candz[4]
-	cdef double candy[6]
-	cdef size_t candylen
+	cdef double candy[5]
+	cdef cvec3 a, b, c
+	cdef double x0, x1, xb, zc, zspan
 	cdef long pk[3]
+	cdef long kx, ky, kz
 	cdef cvec3 pmin, pmax
 	cdef double xmin,xmax, ymin,ymax, zmin,zmax
 	cdef cvec3 space[3]
@@ -208,6 +231,7 @@ def rasterize_triangle(spaceo, double cell):
 	dy = -n.y/n.z
 	o = space[0]
 	cell2 = cell/2
+	zspan = (fabs(dx) + fabs(dy)) * cell2
 	pmin = cvec3(
 			min(space[0].x, space[1].x, space[2].x),
 			min(space[0].y, space[1].y, space[2].y),
@@ -219,52 +243,58 @@ def rasterize_triangle(spaceo, double cell):
 			max(space[0].z, space[1].z, space[2].z),
 			)
 	xmin,xmax = pmin.x,pmax.x
-	for i in range(3):	varr(&pmin)[i] -= pmod(varr(&pmin)[i], cell)
-	for i in range(3):	varr(&pmax)[i] += cell - pmod(varr(&pmax)[i], cell)
+	for i in range(3):	varr(&pmin)[i] = cellfloor(varr(&pmin)[i], cell)
+	for i in range(3):	varr(&pmax)[i] = cellfloor(varr(&pmax)[i], cell) + cell
+	
+	# sort the vertices along x, the y span of a column is then bounded by the edge a-c on one side and the edges a-b-c on the other
+	a, b, c = space[0], space[1], space[2]
+	if b.x < a.x:	a, b = b, a
+	if c.x < b.x:	b, c = c, b
+	if b.x < a.x:	a, b = b, a
 	
 	# x selection
 	xmin -= prec
 	xmax += prec
-	xmin -= pmod(xmin,cell)
+	xmin = cellfloor(xmin, cell)
+	# keys of the cells are stepped as integers from the first cell of each span
+	kx = key(xmin+cell2, cell)
 	for i in range(max(1,<size_t>ceil((xmax-xmin)/cell))):
 		x = xmin + cell*i + cell2
 	
 		# y selection
-		candylen = 0
-		for i in range(3):
-			# NOTE: cet interval ajoute parfois des cases inutiles apres les sommets
-			if (space[(i+1)%3].x-x+cell2)*(space[i].x-x-cell2) <= 0 or (space[(i+1)%3].x-x-cell2)*(space[i].x-x+cell2) <= 0:
-				d = v[i].y / (v[i].x if v[i].x else INFINITY)
-				candy[candylen]   = ( space[i].y + d * (x-cell2-space[i].x) )
-				candy[candylen+1] = ( space[i].y + d * (x+cell2-space[i].x) )
-				candylen += 2
-		ymin,ymax = max(pmin.y,amin(candy,candylen)), min(pmax.y,amax(candy,candylen))
+		x0 = min(max(x-cell2, a.x), c.x)
+		x1 = max(min(x+cell2, c.x), a.x)
+		xb = min(max(b.x, x0), x1)
+		candy[0] = ylerp(a, c, x0)
+		candy[1] = ylerp(a, c, x1)
+		candy[2] = ylerp(a, b, x0)  if x0 < b.x else  ylerp(b, c, x0)
+		candy[3] = ylerp(a, b, x1)  if x1 < b.x else  ylerp(b, c, x1)
+		# the middle vertex when in the column, else a point already in the candidates
+		candy[4] = ylerp(a, b, xb)  if xb < b.x else  ylerp(b, c, xb)
+		ymin,ymax = max(pmin.y,amin(candy,5)), min(pmax.y,amax(candy,5))
 		ymin -= prec
 		ymax += prec
-		ymin -= pmod(ymin,cell)
+		ymin = cellfloor(ymin, cell)
 		if ymax < ymin:	continue
+		ky = key(ymin+cell2, cell)
 		for j in range(max(1,<size_t>ceil((ymax-ymin)/cell))):
 			y = ymin + cell*j + cell2
 		
-			# z selection
-			candz = [
-				o.z + dx*(x-cell2-o.x) + dy*(y-cell2-o.y),
-				o.z + dx*(x+cell2-o.x) + dy*(y-cell2-o.y),
-				o.z + dx*(x-cell2-o.x) + dy*(y+cell2-o.y),
-				o.z + dx*(x+cell2-o.x) + dy*(y+cell2-o.y),
-				]
-			zmin,zmax = max(pmin.z,amin(candz,4)), min(pmax.z,amax(candz,4))
+			# z selection, the plane over the cell corners spans zc +- zspan
+			zc = o.z + dx*(x-o.x) + dy*(y-o.y)
+			zmin,zmax = max(pmin.z, zc-zspan), min(pmax.z, zc+zspan)
 			zmin -= prec
 			zmax += prec
-			zmin -= pmod(zmin,cell)
+			zmin = cellfloor(zmin, cell)
 			if zmax < zmin:	continue
+			kz = key(zmin+cell2, cell)
 			for k in range(max(1,<size_t>ceil((zmax-zmin)/cell))):
 				z = zmin + cell*k + cell2
 				
 				# remove box from corners that goes out of the area
 				if pmin.x<x and pmin.y<y and pmin.z<z and x<pmax.x and y<pmax.y and z<pmax.z:
-					pk = [key(x,cell), key(y,cell), key(z,cell)]
-					rasterization.append(( pk[reorder[0]], pk[reorder[1]], pk[reorder[2]] ))
+					pk = [kx+<long>i, ky+<long>j, kz+<long>k]
+					rasterization.append(pack(pk[reorder[0]], pk[reorder[1]], pk[reorder[2]]))
 	return rasterization
 
 
@@ -243,10 +243,11 @@ class AnnotationDisplay(Display):
 						fragment_shader=open(ressourcedir+'/shaders/annotation.frag').read(),
 						)
 		self.shader = scene.ressource('shader_annotation', load)
+		self.ident_shader = scene.ressource('shader_ident')
 		# allocate buffers
 		vb_pts = scene.ctx.buffer(points)
 		self.va = scene.ctx.vertex_array(self.shader, [(vb_pts, '3f f', 'v_position', 'v_alpha')])
-		self.va_ident = scene.ctx.vertex_array(scene.ressource('shader_ident'), [(vb_pts, '3f 4x', 'v_position')])
+		self.va_ident = scene.ctx.vertex_array(self.ident_shader, [(vb_pts, '3f 4x', 'v_position')])
 	
 	@staticmethod
 	def buff_ptsalpha(points, alpha):
@@ -262,7 +263,7 @@ class AnnotationDisplay(Display):
 		self.va.render(mgl.LINES)
 	
 	def identify(self, view):
-		shader = view.scene.ressource('shader_ident')
+		shader = self.ident_shader
 		shader['proj'].write(view.uniforms['proj'])
 		shader['view'].write(view.uniforms['view'] * self.world)
 		shader['ident'] = view.identstep(1)
@@ -309,6 +310,8 @@ class BoxDisplay(AnnotationDisplay):
 
 class SolidDisplay(Display):
 	''' Display render Meshes '''
+	cullable = True
+	
 	def __init__(self, scene, positions, normals, faces, lines, idents, color=None):
 		self.box = npboundingbox(positions)
 		self.options = scene.options
@@ -358,6 +361,8 @@ class SolidDisplay(Display):
 
 class WebDisplay(Display):
 	''' Display to render Webs '''
+	cullable = True
+	
 	def __init__(self, scene, positions, lines, points, idents, color=None):
 		self.box = npboundingbox(positions)
 		self.options = scene.options
@@ -394,13 +399,13 @@ class WebDisplay(Display):
 class Vertices(object):
 	''' convenient class to share vertices between SolidDisplay, WebDisplay, PointsDisplay '''
 	def __init__(self, ctx, positions, idents):
-		self.idents = idents
+		self.idents = idents = np.array(idents, dtype='u2', copy=False)
 		self.nident = int(max(idents))+1
 		self.flags = np.zeros(len(positions), dtype='u1')
 		self.flags_updated = False
 		assert len(idents) == len(positions)
 		self.vb_positions = ctx.buffer(np.array(positions, dtype='f4', copy=False))
-		self.vb_idents = ctx.buffer(np.array(idents, dtype='u2', copy=False))
+		self.vb_idents = ctx.buffer(idents)
 		self.vb_flags = self.vb_flags = ctx.buffer(self.flags, dynamic=True)
 		self.world = fmat4(1)
 		
@@ -410,8 +415,7 @@ class Vertices(object):
 			self.flags_updated = False
 	
 	def selectsub(self, sub):
-		for i,id in enumerate(self.idents):
-			self.flags[i] ^= id == sub
+		self.flags ^= self.idents == sub
 		self.flags_updated = True
 			
 
@@ -5,11 +5,12 @@
 	The complexity and therefore the cost of those operations are most of the time close to the hashmap complexity O(1). It means data is found in time independently of the actual size of the mesh or whatever storage it is.
 '''
 
-from .mathutils import vec3, i64vec3, noproject, norminf, normalize, dot, glm, cross, length, NUMPREC
+from .mathutils import vec3, noproject, norminf, normalize, dot, glm, length, NUMPREC
 from . import core
 from . import mesh
-from functools import reduce
-from math import floor, ceil, sqrt, inf
+from math import floor, sqrt
+from array import array
+import numpy as np
 
 
 class PositionMap:
@@ -19,131 +20,19 @@ class PositionMap:
 		
 		Attributes defined here:
 			:cellsize:    the boxing parameter (DON'T CHANGE IT IF NON-EMPTY)
-			:dict:        the hashmap from box to objects lists
+			:dict:        the hashmap from box to objects lists, boxes are keyed by their position packed in an integer (see `cellkey`)
+			:dtype:       if not None, the `array` typecode the objects lists are stored with, use it when the objects are integers (like indices in a buffer) to save memory
+			:frozen:      None, or the flat arrays `(keys, offsets, objects)` replacing `dict` once `freeze` has been called
 	'''
-	__slots__ = 'cellsize', 'dict', 'options'
-	def __init__(self, cellsize, iterable=None):
+	__slots__ = 'cellsize', 'dict', 'dtype', 'frozen', 'options'
+	def __init__(self, cellsize, iterable=None, dtype=None):
 		self.options = {}
 		self.cellsize = cellsize
 		self.dict = {}
+		self.dtype = dtype
+		self.frozen = None
 		if iterable:	self.update(iterable)
 
-	def keysfor(self, space):
-		''' rasterize the primitive, yielding the successive position keys 
-			currently allowed primitives are 
-				points:	vec3
-				segments:  (vec3,vec3)
-				triangles: (vec3,vec3,vec3)
-		'''
-		cell = self.cellsize
-		# point
-		if isinstance(space, vec3):
-			yield tuple(i64vec3(glm.floor(space/cell)))
-		
-		# segment
-		elif isinstance(space, tuple) and len(space) == 2:
-			# permutation of coordinates to get the direction the closer to Z
-			n = glm.abs(space[1]-space[0])
-			if max(n) < NUMPREC*max((max(p) for p in space)):	return
-			if   n[1] >= n[0] and n[1] >= n[2]:	order,reorder = (2,0,1),(1,2,0)
-			elif n[0] >= n[1] and n[0] >= n[2]:	order,reorder = (1,2,0),(2,0,1)
-			else:								order,reorder = (0,1,2),(0,1,2)
-			space = [ vec3(p[order[0]], p[order[1]], p[order[2]])	for p in space]
-			
-			# prepare variables
-			cell2 = cell/2
-			v = space[1]-space[0]
-			dy = v[1]/v[2]
-			dx = v[0]/v[2]
-			o = space[0]
-			fy = lambda z:	o[1] + dy*(z-o[2])
-			fx = lambda z:	o[0] + dx*(z-o[2])
-			
-			# z selection
-			if v[2] > 0:	zmin,zmax = space[0][2], space[1][2]
-			else:			zmin,zmax = space[1][2], space[0][2]
-			zmin -= zmin%cell
-			for i in range(max(1,ceil((zmax-zmin)/cell))):
-				z = zmin + cell*i + cell2
-				
-				# y selection
-				if dy > 0:	ymin,ymax = fy(z-cell2), fy(z+cell2)
-				else:		ymin,ymax = fy(z+cell2), fy(z-cell2)
-				ymin -= ymin%cell
-				for j in range(max(1,ceil((ymax-ymin)/cell))):
-					y = ymin + j*cell + cell2
-					
-					# x selection
-					if dx > 0:	xmin,xmax = fx(z-cell2), fx(z+cell2)
-					else:		xmin,xmax = fx(z+cell2), fx(z-cell2)
-					xmin -= xmin%cell
-					for k in range(max(1,ceil((xmax-xmin)/cell))):
-						x = xmin + k*cell + cell2
-						
-						p = (x,y,z)
-						yield tuple([floor(p[i]/cell)		for i in reorder])
-		
-		# triangle
-		elif isinstance(space, tuple) and len(space) == 3:
-			# permutation of coordinates to get the normal the closer to Z
-			n = glm.abs(cross(space[1]-space[0], space[2]-space[0]))
-			if max(n) < NUMPREC*max((max(p) for p in space)):	return
-			if   n[1] >= n[0] and n[1] >= n[2]:	order,reorder = (2,0,1),(1,2,0)
-			elif n[0] >= n[1] and n[0] >= n[2]:	order,reorder = (1,2,0),(2,0,1)
-			else:								order,reorder = (0,1,2),(0,1,2)
-			space = [ vec3(p[order[0]], p[order[1]], p[order[2]])	for p in space]
-			
-			# prepare variables
-			v = [space[i-1]-space[i]	for i in range(3)]
-			n = cross(v[0],v[1])
-			dx = -n[0]/n[2]
-			dy = -n[1]/n[2]
-			o = space[0]
-			fz = lambda x,y:	o[2] + dx*(x-o[0]) + dy*(y-o[1])
-			cell2 = cell/2
-			pmin = reduce(glm.min, space)
-			pmax = reduce(glm.max, space)
-			xmin,xmax = pmin[0],pmax[0]
-			pmin -= pmin%cell
-			pmax += cell - pmax%cell
-			
-			# x selection
-			xmin -= xmin%cell
-			for i in range(max(1,ceil((xmax-xmin)/cell))):
-				x = xmin + cell*i + cell2
-			
-				# y selection
-				cand = []
-				for i in range(3):
-					# NOTE: cet interval ajoute parfois des cases inutiles apres les sommets
-					if (space[i-1][0]-x+cell2)*(space[i][0]-x-cell2) <= 0 or (space[i-1][0]-x-cell2)*(space[i][0]-x+cell2) <= 0:
-						d = v[i][1]/(v[i][0] if v[i][0] else inf)
-						cand.append( space[i][1] + d * (x-cell2-space[i][0]) )
-						cand.append( space[i][1] + d * (x+cell2-space[i][0]) )
-				ymin,ymax = max(pmin[1],min(cand)), min(pmax[1],max(cand))
-				ymin -= ymin%cell
-				for j in range(max(1,ceil((ymax-ymin)/cell))):
-					y = ymin + cell*j + cell2
-				
-					# z selection
-					cand = []
-					cand.append( fz(x-cell2, y-cell2) )
-					cand.append( fz(x+cell2, y-cell2) )
-					cand.append( fz(x-cell2, y+cell2) )
-					cand.append( fz(x+cell2, y+cell2) )
-					zmin,zmax = max(pmin[2],min(cand)), min(pmax[2],max(cand))
-					zmin -= zmin%cell
-					for k in range(max(1,ceil((zmax-zmin)/cell))):
-						z = zmin + cell*k + cell2
-						
-						# remove box from corners that goes out of the area
-						p = (x,y,z)
-						if pmin[0]<p[0] and pmin[1]<p[1] and pmin[2]<p[2] and p[0]<pmax[0] and p[1]<pmax[1] and p[2]<pmax[2]:
-							yield tuple([floor(p[i]/cell)	for i in reorder])
-		
-		else:
-			raise TypeError("PositionMap only supports keys of type:  points, segments, triangles")
-	
 	def keysfor(self, space):
 		''' rasterize the primitive, yielding the successive position keys 
 			currently allowed primitives are 
@@ -153,7 +42,8 @@ class PositionMap:
 		'''
 		# point
 		if isinstance(space, vec3):
-			return tuple(i64vec3(glm.floor(space/cell))),
+			cell = self.cellsize
+			return cellkey(*cellfloor(space.x/cell, space.y/cell, space.z/cell)),
 		# segment
 		elif isinstance(space, tuple) and len(space) == 2:
 			return core.rasterize_segment(space, self.cellsize)
@@ -164,12 +54,24 @@ class PositionMap:
 			raise TypeError("PositionMap only supports keys of type:  points, segments, triangles")
 	
 	def update(self, other):
-		''' add the elements from an other PositionMap or from an iteravble '''
+		''' add the elements from an other PositionMap or from an iteravble 
+		
+			merging maps is cheap compared to rasterizing the primitives again, so a map can be built by parts (for instance in separate processes) and merged afterward
+		'''
+		if self.frozen:	raise ValueError("a frozen PositionMap cannot receive new objects")
 		if isinstance(other, PositionMap):
 			assert self.cellsize == other.cellsize
-			for k,v in other.dict.items():
+			if other.frozen:
+				keys, offsets, objs = other.frozen
+				if isinstance(objs, np.ndarray):	objs = objs.tolist()
+				offsets = offsets.tolist()
+				items = ((k, objs[offsets[i]:offsets[i+1]])	for i,k in enumerate(keys.tolist()))
+			else:
+				items = other.dict.items()
+			for k,v in items:
 				if k in self.dict:	self.dict[k].extend(v)
-				else:				self.dict[k] = v
+				elif self.dtype:	self.dict[k] = array(self.dtype, v)
+				else:				self.dict[k] = list(v)
 		elif hasattr(other, '__iter__'):
 			for space,obj in other:
 				self.add(space,obj)
@@ -178,15 +80,66 @@ class PositionMap:
 	
 	def add(self, space, obj):
 		''' add an object associated with a primitive '''
+		if self.frozen:	raise ValueError("a frozen PositionMap cannot receive new objects")
 		for k in self.keysfor(space):
-			if k not in self.dict:	self.dict[k] = [obj]
-			else:					self.dict[k].append(obj)
+			if k in self.dict:		self.dict[k].append(obj)
+			elif self.dtype:		self.dict[k] = array(self.dtype, (obj,))
+			else:					self.dict[k] = [obj]
+	
+	def addpoints(self, points, objs):
+		''' add many points at once, the same as calling `add(points[i], objs[i])` for each point but computed by arrays
+		
+			:points:   a `(N,3)` array of coordinates, or a list of vec3
+			:objs:     a sequence of N objects, or an integer array when `dtype` is set
+		'''
+		if self.frozen:	raise ValueError("a frozen PositionMap cannot receive new objects")
+		if not isinstance(points, np.ndarray):	points = np.array(glm.array(points))
+		cells = np.floor(points.astype(np.float64, copy=False) / self.cellsize).astype(np.int64)
+		keys = (cells[:,0] & 0x1fffff) << 42 | (cells[:,1] & 0x1fffff) << 21 | (cells[:,2] & 0x1fffff)
+		order = np.argsort(keys, kind='stable')
+		unique, starts = np.unique(keys[order], return_index=True)
+		stops = np.append(starts[1:], len(order))
+		if self.dtype:	objs = np.asarray(objs, dtype=self.dtype)[order]
+		else:			objs = [objs[i]	for i in order.tolist()]
+		
+		buckets = self.dict
+		for k, start, stop in zip(unique.tolist(), starts.tolist(), stops.tolist()):
+			if k not in buckets:	
+				buckets[k] = array(self.dtype) if self.dtype else []
+			if self.dtype:	buckets[k].frombytes(objs[start:stop].tobytes())
+			else:			buckets[k].extend(objs[start:stop])
 	
 	def get(self, space):
 		''' get the objects associated with the given primitive '''
-		for k in self.keysfor(space):
-			if k in self.dict:
-				yield from self.dict[k]
+		if self.frozen:
+			keys, offsets, objs = self.frozen
+			query = np.fromiter(self.keysfor(space), dtype=np.int64)
+			if not len(keys):	return
+			found = np.searchsorted(keys, query).clip(0, len(keys)-1)
+			for i in found[keys[found] == query]:
+				yield from objs[offsets[i]:offsets[i+1]]
+		else:
+			for k in self.keysfor(space):
+				if k in self.dict:
+					yield from self.dict[k]
+	
+	def freeze(self):
+		''' pack the map content in flat arrays sorted by key, for a map built once and queried many times
+			
+			the memory footprint is much smaller, and `get` then finds the cells by dichotomy. 
+			A frozen map cannot receive new objects.
+		'''
+		if self.frozen:	return
+		keys = np.fromiter(self.dict.keys(), dtype=np.int64, count=len(self.dict))
+		counts = np.fromiter(map(len, self.dict.values()), dtype=np.int64, count=len(self.dict))
+		order = np.argsort(keys)
+		offsets = np.zeros(len(keys)+1, dtype=np.int64)
+		np.cumsum(counts[order], out=offsets[1:])
+		buckets = list(self.dict.values())
+		objs = [obj	for i in order	for obj in buckets[i]]
+		if self.dtype:	objs = np.array(objs, dtype=self.dtype)
+		self.frozen = keys[order], offsets, objs
+		self.dict = {}
 				
 	def __contains__(self, space):
 		return next(self.get(space), None) is not None
@@ -206,14 +159,45 @@ class PositionMap:
 			],
 		)
 	def display(self, scene):
-		web = mesh.Web()
+		if self.frozen:	keys = self.frozen[0]
+		else:			keys = np.fromiter(self.dict, dtype=np.int64, count=len(self.dict))
+		# cells positions unpacked from the keys as `cellpos` does
+		origins = np.stack([((keys >> shift) & 0x1fffff ^ 0x100000) - 0x100000	for shift in (42, 21, 0)], axis=1)
+		# one cube per cell
+		corners = np.array(glm.array(self._display[0]))
+		points = (origins[:,None,:] + corners[None,:,:]) * self.cellsize
+		edges = np.array(self._display[1])[None,:,:] + len(corners) * np.arange(len(keys))[:,None,None]
+		web = mesh.Web(
+				glm.array(points.reshape(-1,3)).to_list(), 
+				list(map(tuple, edges.reshape(-1,2).tolist())), 
+				np.repeat(np.arange(len(keys)), len(self._display[1])).tolist(), 
+				keys.tolist(),
+				)
 		if 'color' in self.options:		web.options['color'] = self.options['color']
-		base = vec3(self.cellsize)
-		for k in self.dict:
-			l = len(web.points)
-			web += mesh.Web([base*(p+k)  for p in self._display[0]], self._display[1], groups=[k])
 		return web.display(scene)
 
+def cellfloor(x, y, z):
+	''' integer position of the cell containing the given coordinates
+		non-finite coordinates get the same position as with a glm integer cast, instead of raising
+	'''
+	try:	return floor(x), floor(y), floor(z)
+	except (ValueError, OverflowError):
+		return tuple(glm.i64vec3(glm.floor(vec3(x, y, z))))
+
+def cellkey(x, y, z):
+	''' hashing key of the cell at the given integer position, as used by `PositionMap` 
+		the coordinates are packed on 21 bits each, so cells further than 2**20 apart alias to the same key (it only costs false candidates)
+	'''
+	return (x & 0x1fffff) << 42 | (y & 0x1fffff) << 21 | (z & 0x1fffff)
+	
+def cellpos(key):
+	''' integer position of the cell for a hashing key, reverse of `cellkey` (up to the aliasing) '''
+	return (
+		((key >> 42) & 0x1fffff ^ 0x100000) - 0x100000,
+		((key >> 21) & 0x1fffff ^ 0x100000) - 0x100000,
+		(key & 0x1fffff ^ 0x100000) - 0x100000,
+		)
+
 def meshcellsize(mesh):
 	''' returns a good cell size to index primitives of a mesh with a PositionMap 
 		
@@ -254,21 +238,24 @@ class PointSet:
 	
 	def keyfor(self, pt):
 		''' hash key for a point '''
-		return tuple(i64vec3(glm.floor(pt/self.cellsize)))
+		cell = self.cellsize
+		return cellfloor(pt.x/cell, pt.y/cell, pt.z/cell)
 		
 	def keysfor(self, pt):
 		''' iterable of positions at whic an equivalent point can be '''
-		vox = pt/self.cellsize
-		k = i64vec3(glm.floor(vox-0.5+NUMPREC)), i64vec3(glm.floor(vox+0.5-NUMPREC))
+		cell = self.cellsize
+		x, y, z = pt.x/cell, pt.y/cell, pt.z/cell
+		x0, y0, z0 = cellfloor(x-0.5+NUMPREC, y-0.5+NUMPREC, z-0.5+NUMPREC)
+		x1, y1, z1 = cellfloor(x+0.5-NUMPREC, y+0.5-NUMPREC, z+0.5-NUMPREC)
 		return (
-			(k[0][0], k[0][1], k[0][2]),
-			(k[1][0], k[0][1], k[0][2]),
-			(k[0][0], k[1][1], k[0][2]),
-			(k[1][0], k[1][1], k[0][2]),
-			(k[0][0], k[0][1], k[1][2]),
-			(k[1][0], k[0][1], k[1][2]),
-			(k[0][0], k[1][1], k[1][2]),
-			(k[1][0], k[1][1], k[1][2]),
+			(x0, y0, z0),
+			(x1, y0, z0),
+			(x0, y1, z0),
+			(x1, y1, z0),
+			(x0, y0, z1),
+			(x1, y0, z1),
+			(x0, y1, z1),
+			(x1, y1, z1),
 			)
 	
 	def update(self, iterable):
@@ -287,7 +274,9 @@ class PointSet:
 		self.points.append(pt)
 		return l
 	def remove(self, pt):
-		''' remove a point '''
+		''' remove a point 
+			the point is only removed from the hashmap, it stays in `points` so the other indices remain valid
+		'''
 		for key in self.keysfor(pt):
 			if key in self.dict:
 				del self.dict[key]
@@ -308,16 +297,72 @@ class PointSet:
 			if key in self.dict:	return self.dict[key]
 		raise IndexError("position doesn't exist in set")
 		
-	__iadd__ = update
-	__isub__ = difference_update
+	def __iadd__(self, iterable):
+		self.update(iterable)
+		return self
+	def __isub__(self, iterable):
+		self.difference_update(iterable)
+		return self
 	def __add__(self, iterable):
-		s = PositionSet()
-		s.union(self.points)
-		s.union(iterable)
+		s = PointSet(self.cellsize, self.indexed())
+		s.update(iterable)
 		return s
 	def __sub__(self, iterable):
-		s = PositionSet()
-		s.union(self.points)
-		s.difference(iterable)
+		s = PointSet(self.cellsize, self.indexed())
+		s.difference_update(iterable)
 		return s
+	
+	def indexed(self):
+		''' the points currently in the set, in the order of their indices
+			(removed points are left in the buffer to keep indices valid)
+		'''
+		return [self.points[i]	for i in sorted(set(self.dict.values()))]
 
+
+
+def pointmerges(points, cellsize):
+	''' for each point of the `(N,3)` array, the index of the point it is merged with when the points are added in order to a `PointSet(cellsize)` (the point itself if it is kept)
+	
+		The points are grouped by the block of cells `PointSet.keysfor` looks at. A group whose block meets no other block merges into its first point, these are resolved by arrays. The remaining points go through the same insertion loop as `PointSet.add`
+	'''
+	pts = points / cellsize
+	lo = np.floor(pts - 0.5 + NUMPREC).astype(np.int64)
+	hi = np.floor(pts + 0.5 - NUMPREC).astype(np.int64)
+	
+	# groups of points looking at the same cells, blocks are keyed by their lowest cell on 20 bits per axis so far blocks can alias
+	def blockkey(x, y, z):
+		return (x & 0xfffff) << 43 | (y & 0xfffff) << 23 | (z & 0xfffff) << 3
+	signature = blockkey(*lo.T) | ((hi-lo) * (1,2,4)).sum(axis=1)
+	_, first, group = np.unique(signature, return_index=True, return_inverse=True)
+	group = group.reshape(-1)
+	# a group is isolated if no other group looks at a cell of its block, aliasing only makes it pessimistic
+	blocks, count = np.unique(signature[first] >> 3 << 3, return_counts=True)
+	def inblocks(keys):
+		idx = np.searchsorted(blocks, keys).clip(0, len(blocks)-1)
+		return blocks[idx] == keys, idx
+	isolated = count[inblocks(signature[first] >> 3 << 3)[1]] == 1
+	x, y, z = lo[first].T
+	for dx, dy, dz in np.ndindex(3,3,3):
+		if (dx, dy, dz) == (1,1,1):	continue
+		isolated &= ~inblocks(blockkey(x+dx-1, y+dy-1, z+dz-1))[0]
+	merges = first[group]
+	# aliased points are left to the insertion loop
+	isolated = isolated[group]
+	isolated &= (lo == lo[merges]).all(axis=1) & (hi == hi[merges]).all(axis=1)
+	
+	# insertion loop for the others
+	remains = np.flatnonzero(~isolated)
+	if len(remains):
+		lo, hi = lo[remains].tolist(), hi[remains].tolist()
+		own = np.floor(pts[remains]).astype(np.int64).tolist()
+		reached = {}
+		for i, (x0,y0,z0), (x1,y1,z1), key in zip(remains.tolist(), lo, hi, own):
+			for k in (	(x0, y0, z0), (x1, y0, z0), (x0, y1, z0), (x1, y1, z0),
+						(x0, y0, z1), (x1, y0, z1), (x0, y1, z1), (x1, y1, z1) ):
+				if k in reached:
+					merges[i] = reached[k]
+					break
+			else:
+				reached[tuple(key)] = i
+				merges[i] = i
+	return merges
@@ -6,7 +6,7 @@ from functools import wraps
 from hashlib import md5
 
 from .mathutils import vec3, glm, inf
-from .mesh import Mesh, Wire
+from .mesh import Mesh, Wire, glmarray
 
 class FileFormatError(Exception):	pass
 
@@ -141,9 +141,7 @@ else:
 		return mesh
 
 	def ply_write(mesh, file, **opts):
-		vertices = np.array(
-						[ tuple(p) for p in mesh.points], 
-						dtype=[('x', 'f4'), ('y', 'f4'), ('z', 'f4')])
+		vertices = glmarray(mesh.points).view([('x', 'f4'), ('y', 'f4'), ('z', 'f4')]).reshape(-1)
 		faces = np.array(
 					[ (f,t)  for f,t in zip(mesh.faces, mesh.tracks)],
 					dtype=[('vertex_indices', 'u4', (3,)), ('group', 'u2')])
@@ -968,7 +968,7 @@ class WireDisplay(rendering.Display):
 		
 		self.vb_vertices = ctx.buffer(np.hstack((
 				np.array([tuple(v) for v in points], dtype='f4', copy=False),
-				np.array([tuple(v) for v in normals], dtype='f4'),
+				glmarray(normals),
 				)))
 		if transpfaces:
 			self.vb_transpfaces = ctx.buffer(np.array(transpfaces, dtype='u4', copy=False))
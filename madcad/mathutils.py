@@ -404,8 +404,8 @@ class Box:
 		else:
 			return NotImplemented
 	
-	def __or__(self, other):	return deepcopy(self).union(other)
-	def __and__(self, other):	return deepcopy(self).intersection(other)
+	def __or__(self, other):	return self.union(other)
+	def __and__(self, other):	return self.intersection(other)
 	
 	def union_update(self, other) -> 'self':
 		''' extend the volume of the current box to bound the given point or box '''
@@ -467,6 +467,13 @@ class Box:
 	def transform(self, trans) -> 'Box':
 		''' box bounding the current one in a transformed space '''
 		if not self.isvalid():	return self
+		if isinstance(trans, (fmat4, dmat4)):
+			# transform the center and bound the half diagonal with the absolute axis, instead of transforming all the corners
+			v3, v4 = (fvec3, fvec4) if isinstance(trans, fmat4) else (dvec3, dvec4)
+			center = v3(trans * v4(v3(self.center), 1))
+			half = v3(self.width) / 2
+			half = abs(v3(trans[0]))*half.x + abs(v3(trans[1]))*half.y + abs(v3(trans[2]))*half.z
+			return Box(center-half, center+half)
 		trans = transformer(trans)
 		return boundingbox((trans(p)  for p in self.corners()))
 	
@@ -23,11 +23,12 @@
 	- the user is allowed to hack into the internal data, ensure that the Mesh is still consistent after.
 '''
 
-from copy import copy, deepcopy
+from copy import copy
 from random import random
 import numpy as np
 from array import array
-from collections import OrderedDict
+from collections import OrderedDict, Counter
+from itertools import chain, compress
 import math
 from .mathutils import *
 from . import displays
@@ -56,9 +57,25 @@ class Container:
 	
 	def transform(self, trans):
 		''' apply the transform to the points of the mesh, returning the new transformed mesh'''
-		trans = transformer(trans)
 		transformed = copy(self)
-		transformed.points = list(map(trans, self.points))
+		if isinstance(trans, dquat):	trans = mat3_cast(trans)
+		if self.points and type(self.points[0]) is dvec3 and isinstance(trans, (dvec3, dmat3, dmat4, int, float)):
+			# transform all points at once
+			pts = glmarray(self.points, None)
+			# matrices are read by columns, the numpy layout of glm matrices changes between PyGLM versions
+			# the products are summed in the same order as glm, so the results are exactly the same as with transformer
+			if isinstance(trans, dvec3):	pts = pts + tuple(trans)
+			elif isinstance(trans, dmat3):
+				cols = np.array([tuple(c) for c in trans])
+				pts = pts[:,0,None]*cols[0] + pts[:,1,None]*cols[1] + pts[:,2,None]*cols[2]
+			elif isinstance(trans, dmat4):
+				cols = np.array([tuple(c) for c in trans])[:,:3]
+				pts = (pts[:,0,None]*cols[0] + pts[:,1,None]*cols[1]) + (pts[:,2,None]*cols[2] + cols[3])
+			else:							pts = pts * trans
+			transformed.points = [dvec3(*p)  for p in pts.tolist()]
+		else:
+			trans = transformer(trans)
+			transformed.points = list(map(trans, self.points))
 		return transformed
 			
 	def mergeclose(self, limit=None, start=0):
@@ -79,12 +96,17 @@ class Container:
 		'''
 		# O(n) implementation thanks to hashing
 		merges = {}
-		points = hashing.PointSet(limit)
-		for i in range(start, len(self.points)):
-			used = points.add(self.points[i])
-			if used != i:	merges[i] = used
+		points = self.points[:start]
+		if len(self.points) > start:
+			used = hashing.pointmerges(glmarray(self.points[start:], None), limit)
+			kept = used == np.arange(len(used))
+			reindex = np.cumsum(kept) - 1 + start
+			for i in np.flatnonzero(kept).tolist():
+				points.append(self.points[start+i])
+			for i, j in enumerate(reindex[used].tolist(), start):
+				if i != j:	merges[i] = j
 		self.mergepoints(merges)
-		self.points = points.points
+		self.points = points
 		return merges
 		
 	def mergegroups(self, defs=None, merges=None):
@@ -106,14 +128,12 @@ class Container:
 		
 	def stripgroups(self):
 		''' remove groups that are used by no faces, return the reindex list '''
-		used = [False] * len(self.groups)
-		for track in self.tracks:
-			used[track] = True
-		self.groups = copy(self.groups)
-		self.tracks = copy(self.tracks)
+		tracks = np.asarray(self.tracks, dtype=np.int64)
+		used = np.zeros(len(self.groups), dtype=bool)
+		used[tracks] = True
+		self.groups = self.groups[:]
 		reindex = striplist(self.groups, used)
-		for i,track in enumerate(self.tracks):
-			self.tracks[i] = reindex[track]
+		self.tracks = np.asarray(reindex, dtype=np.int64)[tracks].tolist()
 		return reindex
 	
 	def finish(self):
@@ -163,24 +183,23 @@ class Container:
 	
 	def pointat(self, point, neigh=NUMPREC):
 		''' return the index of the first point at the given location, or None '''
-		for i,p in enumerate(self.points):
-			if distance(p,point) <= neigh:	return i
+		if not self.points:	return None
+		dist = np.linalg.norm(glmarray(self.points, None) - tuple(point), axis=1)
+		found = np.flatnonzero(dist <= neigh)
+		if len(found):	return int(found[0])
 	
 	def pointnear(self, point):
 		''' return the nearest point the the given location '''
-		return min(	range(len(self.points)), 
-					lambda i: distance(self.points[i], point))
+		dist2 = np.square(glmarray(self.points, None) - tuple(point)).sum(axis=1)
+		return int(np.argmin(dist2))
 					
 	def box(self):
 		''' return the extreme coordinates of the mesh (vec3, vec3) '''
 		if not self.points:		return Box()
-		max = deepcopy(self.points[0])
-		min = deepcopy(self.points[0])
-		for pt in self.points:
-			for i in range(3):
-				if   pt[i] < min[i]:	min[i] = pt[i]
-				elif pt[i] > max[i]:	max[i] = pt[i]
-		return Box(min, max)
+		buff = glmarray(self.points, None)
+		vtype = type(self.points[0])
+		# like comparisons, nan coordinates do not extend the box
+		return Box(vtype(np.nanmin(buff, axis=0)), vtype(np.nanmax(buff, axis=0)))
 		
 		
 	def option(self, update=None, **kwargs):
@@ -241,15 +260,13 @@ class Mesh(Container):
 			else:
 				lp = len(self.points)
 				self.points.extend(other.points)
-				for a,b,c in other.faces:
-					self.faces.append((a+lp, b+lp, c+lp))
+				self.faces.extend(zip(*(indexarray(other.faces, 3) + lp).T.tolist()))
 			if self.groups is other.groups:
 				self.tracks.extend(other.tracks)
 			else:
 				lt = len(self.groups)
 				self.groups.extend(other.groups)
-				for track in other.tracks:
-					self.tracks.append(track+lt)
+				self.tracks.extend((np.asarray(other.tracks, dtype=np.int64) + lt).tolist())
 			return self
 		else:
 			return NotImplemented
@@ -260,19 +277,15 @@ class Mesh(Container):
 		''' merge points with the merge dictionnary {src index: dst index}
 			merged points are not removed from the buffer.
 		'''
-		i = 0
-		while i < len(self.faces):
-			f = self.faces[i]
-			self.faces[i] = f = (
-				merges.get(f[0], f[0]),
-				merges.get(f[1], f[1]),
-				merges.get(f[2], f[2]),
-				)
-			if f[0] == f[1] or f[1] == f[2] or f[2] == f[0]:
-				self.faces.pop(i)
-				self.tracks.pop(i)
-			else:
-				i += 1
+		if not self.faces:	return
+		faces = indexarray(self.faces, 3)
+		if merges:
+			remap = np.arange(max(faces.max(), max(merges))+1)
+			remap[np.fromiter(merges.keys(), np.int64, len(merges))] = np.fromiter(merges.values(), np.int64, len(merges))
+			faces = remap[faces]
+		keep = (faces[:,0] != faces[:,1]) & (faces[:,1] != faces[:,2]) & (faces[:,2] != faces[:,0])
+		self.faces = list(zip(*faces[keep].T.tolist()))
+		self.tracks = np.array(self.tracks)[keep].tolist()
 	
 	def strippoints(self, used=None):
 		''' remove points that are used by no faces, return the reindex list.
@@ -280,16 +293,13 @@ class Mesh(Container):
 			
 			return a table of the reindex made
 		'''
+		faces = indexarray(self.faces, 3)
 		if used is None:
-			used = [False] * len(self.points)
-			for face in self.faces:
-				for p in face:
-					used[p] = True
-		self.points = copy(self.points)
-		self.faces = copy(self.faces)
+			used = np.zeros(len(self.points), dtype=bool)
+			used[faces.reshape(-1)] = True
+		self.points = self.points[:]
 		reindex = striplist(self.points, used)
-		for i,f in enumerate(self.faces):
-			self.faces[i] = (reindex[f[0]], reindex[f[1]], reindex[f[2]])
+		self.faces = list(zip(*np.asarray(reindex, dtype=np.int64)[faces].T.tolist()))
 		return reindex
 	
 	def flip(self):
@@ -340,14 +350,13 @@ class Mesh(Container):
 	
 	def groupnear(self, point):
 		''' return the id of the group for the nearest surface to the given point '''
-		track = None
-		best = math.inf
-		for i,face in enumerate(self.faces):
-			n = self.facenormal(i)
-			dist = abs(dot(point - self.points[face[0]], n))		# TODO intergrer les limites du triangle
-			if dist < best:
-				track = self.tracks[i]
-		return track
+		if not self.faces:	return None
+		points = glmarray(self.points, None)
+		faces = indexarray(self.faces, 3)
+		dist = np.abs(((tuple(point) - points[faces[:,0]]) * trinormals(points, faces)).sum(axis=1))		# TODO intergrer les limites du triangle
+		dist[np.isnan(dist)] = math.inf
+		i = int(np.argmin(dist))
+		return self.tracks[i]  if dist[i] < math.inf else None
 	
 	
 	# --- extraction methods ---
@@ -363,53 +372,72 @@ class Mesh(Container):
 	
 	def facenormals(self):
 		''' list normals for each face '''
-		return list(map(self.facenormal, self.faces))
+		return [vec3(*n)  for n in self.facenormals_array().tolist()]
+	
+	def facenormals_array(self):
+		''' normals for each face, as a numpy array of shape (N,3) '''
+		if not self.faces:	return np.empty((0,3))
+		return trinormals(glmarray(self.points, None), indexarray(self.faces, 3))
 	
 	def edgenormals(self):
 		''' dict of normals for each UNORIENTED edge '''
-		normals = {}
-		for face in self.faces:
-			normal = self.facenormal(face)
-			for edge in ((face[0], face[1]), (face[1], face[2]), (face[2],face[0])):
-				e = edgekey(*edge)
-				normals[e] = normals.get(e,0) + normal
-		for e,normal in normals.items():
-			normals[e] = normalize(normal)
-		return normals
+		if not self.faces:	return {}
+		n = len(self.points)
+		points = glmarray(self.points, None)
+		faces = indexarray(self.faces, 3)
+		keys, inverse = np.unique(packedges(faceedges(faces), n), return_inverse=True)
+		# each face normal is summed to its 3 edges, per coordinate as bincount is much faster than np.add.at
+		contribs = np.repeat(trinormals(points, faces), 3, axis=0)
+		normals = np.stack([np.bincount(inverse.reshape(-1), contribs[:,i], len(keys))  for i in range(3)], axis=1)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+		return dict(zip(
+				zip((keys // n).tolist(), (keys % n).tolist()), 
+				[vec3(*normal)  for normal in normals.tolist()],
+				))
 	
 		
 	def vertexnormals(self):
 		''' list of normals for each point '''
+		l = len(self.points)
+		if not self.faces:	return [normalize(vec3(0))  for _ in range(l)]
 		
 		# collect the mesh border as edges and as points
-		outline = self.outlines_oriented()
-		border = set()
-		for a,b in outline:
-			border.add(a)
-			border.add(b)
+		outline = np.array(sorted(a*l+b  for a,b in self.outlines_oriented()), dtype=np.int64)
+		border = np.zeros(l, dtype=bool)
+		border[outline // l] = True
+		border[outline % l] = True
+		
+		points = glmarray(self.points, None)
+		faces = indexarray(self.faces, 3)
+		facenormals = trinormals(points, faces)
+		valid = np.isfinite(facenormals).all(axis=1)
 		
 		# sum contributions to normals
-		l = len(self.points)
-		normals = [vec3(0) for _ in range(l)]
-		for face in self.faces:
-			normal = self.facenormal(face)
-			if not isfinite(normal):	continue
-			for i in range(3):
-				o = self.points[face[i]]
-				# point on the surface
-				if face[i] not in border:
-					# triangle normals are weighted by their angle at the point
-					contrib = anglebt(self.points[face[i-2]]-o, self.points[face[i-1]]-o)
-					normals[face[i]] += contrib * normal
-				# point on the outline
-				elif (face[i], face[i-1]) in outline:
-					# only the triangle creating the edge does determine its normal
-					normals[face[i]] += normal
-					normals[face[i-1]] += normal
-		
-		for i in range(l):
-			normals[i] = normalize(normals[i])
-		return normals
+		normals = np.zeros((l,3))
+		for i in range(3):
+			o = points[faces[:,i]]
+			# point on the surface
+			surface = valid & ~border[faces[:,i]]
+			# triangle normals are weighted by their angle at the point
+			x = points[faces[:,i-2]] - o
+			y = points[faces[:,i-1]] - o
+			n = np.linalg.norm(x, axis=1) * np.linalg.norm(y, axis=1)
+			with np.errstate(invalid='ignore', divide='ignore'):
+				contrib = np.where(n != 0, np.arccos(np.clip((x*y).sum(axis=1)/n, -1, 1)), 0)
+			np.add.at(normals, faces[surface,i], contrib[surface,None] * facenormals[surface])
+			# point on the outline
+			if len(outline):
+				key = faces[:,i]*l + faces[:,i-1]
+				found = np.searchsorted(outline, key).clip(0, len(outline)-1)
+				edge = valid & (outline[found] == key)
+				# only the triangle creating the edge does determine its normal
+				np.add.at(normals, faces[edge,i], facenormals[edge])
+				np.add.at(normals, faces[edge,i-1], facenormals[edge])
+		
+		with np.errstate(invalid='ignore', divide='ignore'):
+			normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+		return [vec3(*n)  for n in normals.tolist()]
 		
 	def tangents(self):
 		''' tangents to outline points '''
@@ -439,53 +467,60 @@ class Mesh(Container):
 	
 	def edges(self):
 		''' set of UNORIENTED edges present in the mesh '''
-		edges = set()
-		for face in self.faces:
-			edges.add(edgekey(face[0], face[1]))
-			edges.add(edgekey(face[1], face[2]))
-			edges.add(edgekey(face[2], face[0]))
-		return edges
+		n = len(self.points)
+		keys = np.unique(packedges(self.edges_oriented_array(), n))
+		return set(zip((keys // n).tolist(), (keys % n).tolist()))
 	
 	def edges_oriented(self):
 		''' iterator of ORIENTED edges, directly retreived of each face '''
-		for face in self.faces:
-			yield face[0], face[1]
-			yield face[1], face[2]
-			yield face[2], face[0]
+		yield from zip(*self.edges_oriented_array().T.tolist())
+	
+	def edges_oriented_array(self):
+		''' array of shape (3*N,2) of the ORIENTED edges of each face, in the same order as `edges_oriented` '''
+		return faceedges(indexarray(self.faces, 3))
 	
 	def group(self, groups):
 		''' return a new mesh linked with this one, containing only the faces belonging to the given groups '''
 		if isinstance(groups, set):			pass
 		elif hasattr(groups, '__iter__'):	groups = set(groups)
 		else:								groups = (groups,)
-		faces = []
-		tracks = []
-		for f,t in zip(self.faces, self.tracks):
-			if t in groups:
-				faces.append(f)
-				tracks.append(t)
-		return Mesh(self.points, faces, tracks, self.groups)
+		selected = [t in groups  for t in self.tracks]
+		return Mesh(self.points, list(compress(self.faces, selected)), list(compress(self.tracks, selected)), self.groups)
 	
 	def outlines_oriented(self):
-		''' return a set of the ORIENTED edges delimiting the surfaces of the mesh '''
-		edges = set()
-		for face in self.faces:
-			for e in ((face[0], face[1]), (face[1], face[2]), (face[2],face[0])):
-				if e in edges:	edges.remove(e)
-				else:			edges.add((e[1], e[0]))
-		return edges
+		''' return a set of the ORIENTED edges delimiting the surfaces of the mesh
+
+			In the face order, a face cancels the outline edge left by a face using the same edge the other way, else it leaves its own edge reversed. So an edge shared by more than 2 faces is on the outline depending on the order of its faces.
+		'''
+		edges = self.edges_oriented_array()
+		# gather the face edges by unoriented edge, keeping the face order in each run
+		order = np.argsort(packedges(edges, len(self.points)), kind='stable')
+		keys = packedges(edges[order], len(self.points))
+		start = np.flatnonzero(np.diff(keys, prepend=-1))
+		count = np.diff(start, append=len(keys))
+
+		# edges used by one face, or by two faces the same way, are on the outline
+		first = order[start[count <= 2]]
+		last = order[start[count <= 2] + count[count <= 2] - 1]
+		kept = (edges[first,0] == edges[last,0]) & ((first == last) | (edges[first,0] != edges[first,1]))
+		outline = set(zip(edges[last[kept],1].tolist(), edges[last[kept],0].tolist()))
+		# non-manifold edges are resolved in the face order
+		for s,c in zip(start[count > 2].tolist(), count[count > 2].tolist()):
+			left = None
+			for a,b in edges[order[s:s+c]].tolist():
+				left = None  if left == (a,b) else (b,a)
+			if left:	outline.add(left)
+		return outline
 	
 	def outlines_unoriented(self):
 		''' return a set of the UNORIENTED edges delimiting the surfaces of the mesh 
 			this method is robust to face orientation aberations
 		'''
-		edges = set()
-		for face in self.faces:
-			for edge in ((face[0],face[1]),(face[1],face[2]),(face[2],face[0])):
-				e = edgekey(*edge)
-				if e in edges:	edges.remove(e)
-				else:			edges.add(e)
-		return edges
+		n = len(self.points)
+		keys, count = np.unique(packedges(self.edges_oriented_array(), n), return_counts=True)
+		# an edge shared by an even number of faces is not on the outline
+		keys = keys[count % 2 == 1]
+		return set(zip((keys // n).tolist(), (keys % n).tolist()))
 	
 	def outlines(self):
 		''' return a Web of ORIENTED edges '''
@@ -496,22 +531,48 @@ class Mesh(Container):
 			
 			On a frontier between multiple groups, there is as many edges as groups, each associated to a group.
 		'''
-		edges = []	# outline
-		tracks = []	# groups for edges
-		tmp = {}	# faces adjacent to edges
-		for i,face in enumerate(self.faces):
-			for e in ((face[1],face[0]),(face[2],face[1]),(face[0],face[2])):
-				track = self.tracks[i]
-				if e in tmp:
-					if tmp[e] != track:
-						edges.append(e)
-						tracks.append(track)
-					del tmp[e]
+		edges = self.edges_oriented_array()
+		tracks = np.repeat(np.asarray(self.tracks, dtype=np.int64), 3)
+		# gather the face edges by unoriented edge, keeping the face order in each run
+		order = np.argsort(packedges(edges, len(self.points)), kind='stable')
+		keys = packedges(edges[order], len(self.points))
+		start = np.flatnonzero(np.diff(keys, prepend=-1))
+		count = np.diff(start, append=len(keys))
+		
+		# each selected edge comes with the group it is associated to, and its rank in the output:
+		# edges between faces come in the order they are met, then the remaining outline in the order it was left
+		first, second = order[start[count == 2]], order[start[count == 2]+1]
+		opposite = edges[first,0] == edges[second,1]
+		keep = ~opposite | (tracks[first] != tracks[second])
+		lone = order[start[count == 1]]
+		selected = [lone, first[keep]]
+		grouped = [tracks[lone], tracks[second[keep]]]
+		rank = [lone + len(edges), np.where(opposite, second, first + len(edges))[keep]]
+		# non-manifold edges are matched in the face order
+		for s,c in zip(start[count > 2].tolist(), count[count > 2].tolist()):
+			pending = None
+			for i in order[s:s+c].tolist():
+				if pending is None:
+					pending, track = i, tracks[i]
+				elif edges[pending,0] == edges[i,1]:
+					if track != tracks[i]:
+						selected.append([pending])
+						grouped.append([tracks[i]])
+						rank.append([i])
+					pending = None
 				else:
-					tmp[(e[1],e[0])] = track
-		edges.extend(tmp.keys())
-		tracks.extend(tmp.values())
-		return Web(self.points, edges, tracks, self.groups)
+					track = tracks[i]
+			if pending is not None:
+				selected.append([pending])
+				grouped.append([track])
+				rank.append([pending + len(edges)])
+		
+		order = np.argsort(np.concatenate(rank))
+		selected = np.concatenate(selected).astype(np.int64)[order]
+		return Web(self.points,
+				list(zip(*edges[selected].T.tolist())),
+				np.concatenate(grouped).astype(np.int64)[order].tolist(),
+				self.groups)
 		
 	def frontiers(self, *args):
 		''' return a Web of UNORIENTED edges that split the given groups appart.
@@ -525,14 +586,16 @@ class Mesh(Container):
 		tracks = []
 		couples = OrderedDict()
 		belong = {}
+		n = len(self.points)
 		for i,face in enumerate(self.faces):
 			if groups and self.tracks[i] not in groups:	continue
-			for edge in ((face[0],face[1]),(face[1],face[2]),(face[2],face[0])):
-				e = edgekey(*edge)
+			for a,b in ((face[0],face[1]),(face[1],face[2]),(face[2],face[0])):
+				e = a*n+b if a < b else b*n+a
 				if e in belong:
 					if belong[e] != self.tracks[i]:
-						g = edgekey(belong[e],self.tracks[i])
-						edges.append(e)
+						x, t = belong[e], self.tracks[i]
+						g = (x,t) if x < t else (t,x)
+						edges.append((a,b) if a < b else (b,a))
 						tracks.append(couples.setdefault(g, len(couples)))
 					del belong[e]
 				else:
@@ -541,23 +604,20 @@ class Mesh(Container):
 	
 	def surface(self):
 		''' total surface of triangles '''
-		s = 0
-		for f in self.faces:
-			a,b,c = self.facepoints(f)
-			s += length(cross(a-b, a,c))/2
-		return s
+		if not self.faces:	return 0
+		points = glmarray(self.points, None)
+		faces = indexarray(self.faces, 3)
+		a, b, c = points[faces[:,0]], points[faces[:,1]], points[faces[:,2]]
+		return float(np.linalg.norm(np.cross(b-a, c-a), axis=1).sum()) / 2
 	
 	def barycenter(self):
 		''' surface barycenter of the mesh '''
 		if not self.faces:	return vec3(0)
-		acc = vec3(0)
-		tot = 0
-		for f in self.faces:
-			a,b,c = self.facepoints(f)
-			weight = length(cross(b-a, c-a))
-			tot += weight
-			acc += weight*(a+b+c)
-		return acc / (3*tot)
+		points = glmarray(self.points, None)
+		faces = indexarray(self.faces, 3)
+		a, b, c = points[faces[:,0]], points[faces[:,1]], points[faces[:,2]]
+		weight = np.linalg.norm(np.cross(b-a, c-a), axis=1)
+		return vec3(*((a+b+c) * weight[:,None]).sum(axis=0) / (3*weight.sum()))
 	
 	def splitgroups(self, edges=None):
 		''' split the mesh groups into connectivity separated groups.
@@ -567,32 +627,33 @@ class Mesh(Container):
 			return a list of tracks for points
 		'''
 		if edges is None:	edges = self.frontiers().edges
+		l = len(self.points)
+		if not self.faces:	return [0] * l
 		# mark points on the frontier
-		frontier = [False]*len(self.points)
-		for a,b in edges:
-			frontier[a] = True
-			frontier[b] = True
+		frontier = np.zeros(l, dtype=bool)
+		edges = indexarray(edges, 2)
+		frontier[edges[:,0]] = True
+		frontier[edges[:,1]] = True
 		# duplicate points and reindex faces
-		points = copy(self.points)
-		idents = [0] * len(self.points)		# track id corresponding to each point
-		duplicated = {}		# new point index for couples (frontierpoint, group)
-		def repl(pt, track):
-			if frontier[pt]:
-				key = (pt,track)
-				if key in duplicated:	i = duplicated[key]
-				else:
-					i = duplicated[key] = len(points)
-					points.append(points[pt])
-					idents.append(track)
-				return i
-			else:
-				idents[pt] = track
-				return pt
-		faces = [(repl(a,t), repl(b,t), repl(c,t))  for (a,b,c),t in zip(self.faces, self.tracks)]
-		
+		corners = indexarray(self.faces, 3).reshape(-1)
+		tracks = np.repeat(np.asarray(self.tracks, dtype=np.int64), 3)
+		front = frontier[corners]
+		idents = np.zeros(l, dtype=np.int64)		# track id corresponding to each point
+		idents[corners[~front]] = tracks[~front]
+		# new point index for couples (frontierpoint, group), in order of appearance
+		keys = corners[front] * (int(tracks.max())+1) + tracks[front]
+		_, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+		order = np.argsort(first)
+		rank = np.empty(len(order), dtype=np.int64)
+		rank[order] = np.arange(len(order))
+		duplicated = np.flatnonzero(front)[first[order]]
+		
+		points = self.points[:]
+		points.extend([points[i]  for i in corners[duplicated].tolist()])
+		corners[front] = l + rank[inverse.reshape(-1)]
 		self.points = points
-		self.faces = faces
-		return idents
+		self.faces = list(zip(*corners.reshape(-1,3).T.tolist()))
+		return idents.tolist() + tracks[duplicated].tolist()
 		
 	# NOTE: splitfaces(self) ?
 		
@@ -602,7 +663,7 @@ class Mesh(Container):
 			conn = connef(self.faces)
 		# propagation
 		islands = []
-		reached = [False] * len(self.faces)	# faces reached
+		reached = bytearray(len(self.faces))	# faces reached
 		stack = []
 		start = 0
 		while True:
@@ -623,9 +684,9 @@ class Mesh(Container):
 				island.tracks.append(self.tracks[i])
 				f = self.faces[i]
 				for i in range(3):
-					e = f[i],f[i-1]
-					if e in conn and not reached[conn[e]]:
-						stack.append(conn[e])
+					n = conn.get((f[i],f[i-1]))
+					if n is not None and not reached[n]:
+						stack.append(n)
 			islands.append(island)
 		return islands
 		
@@ -634,7 +695,7 @@ class Mesh(Container):
 		if not conn:	
 			conn = connef(self.faces)
 		
-		reached = [False] * len(self.faces)	# faces reached
+		reached = bytearray(len(self.faces))	# faces reached
 		stack = []
 		# procedure for finding the new islands to propagate on
 		if not find:
@@ -659,9 +720,9 @@ class Mesh(Container):
 				atface(i, reached)
 				f = self.faces[i]
 				for i in range(3):
-					e = f[i],f[i-1]
-					if e in conn and not reached[conn[e]]:
-						stack.append(conn[e])
+					n = conn.get((f[i],f[i-1]))
+					if n is not None and not reached[n]:
+						stack.append(n)
 			if atisland:
 				atisland(reached)
 				
@@ -697,16 +758,24 @@ class Mesh(Container):
 			center = self.barycenter()
 			metric = lambda p, n: (length2(p-center), abs(dot(n, p-center)))
 			orient = lambda p, n: dot(n, p-center)
-		if not conn:	
-			conn = Asso(  (edgekey(*e),i)
-							for i,f in enumerate(self.faces)
-							for e in ((f[0],f[1]), (f[1],f[2]), (f[2],f[0]))
-							)
+		if conn:
+			neighbours = lambda a, b: conn[edgekey(a,b)]
+		else:
+			# faces sorted by unoriented edge, each edge key gives the slice of the faces sharing it
+			l = len(self.points)
+			keys = packedges(self.edges_oriented_array(), l)
+			order = np.argsort(keys, kind='stable')
+			keys, first, count = np.unique(keys[order], return_index=True, return_counts=True)
+			owners = (order // 3).tolist()
+			slices = dict(zip(keys.tolist(), zip(first.tolist(), (first+count).tolist())))
+			def neighbours(a, b):
+				start, stop = slices[a*l+b if a < b else b*l+a]
+				return owners[start:stop]
 		
 		faces = self.faces[:]
 		normals = self.facenormals()
 		
-		reached = [False] * len(self.faces)	# faces reached
+		reached = bytearray(len(self.faces))	# faces reached
 		stack = []
 		
 		# propagation
@@ -735,8 +804,7 @@ class Mesh(Container):
 				
 				f = faces[i]
 				for i in range(3):
-					e = f[i], f[i-1]
-					for n in conn[edgekey(*e)]:
+					for n in neighbours(f[i], f[i-1]):
 						if reached[n]:	continue
 						nf = faces[n]
 						# check for orientation continuity
@@ -786,20 +854,6 @@ class Mesh(Container):
 				p = (self.points[f[0]] + self.points[f[1]] + self.points[f[2]]) /3
 				grp.append(text.TextDisplay(scene, p, str(self.tracks[i]), 9, (1, 0.2, 0), align=('center', 'center'), layer=-4e-4))
 		
-		fn = np.array([tuple(self.facenormal(f)) for f in self.faces])
-		points = np.array([tuple(p) for p in self.points], dtype=np.float32)		
-		edges = []
-		for i in range(0, 3*len(self.faces), 3):
-			edges.append((i, i+1))
-			edges.append((i+1, i+2))
-			edges.append((i, i+2))
-		
-		idents = []
-		for i in self.tracks:
-			idents.append(i)
-			idents.append(i)
-			idents.append(i)
-		
 		m = copy(self)
 		idents = m.splitgroups()
 		edges = m.groupoutlines().edges
@@ -872,15 +926,11 @@ def reprarray(array, name):
 
 def striplist(list, used):
 	''' remove all elements of list that match a False in used, return a reindexation list '''
-	reindex = [-1] * len(list)
-	j = 0
-	for i,u in enumerate(used):
-		if u:
-			list[j] = list[i]
-			reindex[i] = j
-			j += 1
-	list[j:] = []
-	return reindex
+	keep = np.flatnonzero(np.asarray(used, dtype=bool))
+	reindex = np.full(len(list), -1, dtype=np.int64)
+	reindex[keep] = np.arange(len(keep))
+	list[:] = [list[i]  for i in keep.tolist()]
+	return reindex.tolist()
 
 
 
@@ -932,15 +982,13 @@ class Web(Container):
 			else:
 				lp = len(self.points)
 				self.points.extend(other.points)
-				for a,b in other.edges:
-					self.edges.append((a+lp, b+lp))
+				self.edges.extend(zip(*(indexarray(other.edges, 2) + lp).T.tolist()))
 			if self.groups is other.groups:
 				self.tracks.extend(other.tracks)
 			else:
 				lt = len(self.groups)
 				self.groups.extend(other.groups)
-				for track in other.tracks:
-					self.tracks.append(track+lt)
+				self.tracks.extend((np.asarray(other.tracks, dtype=np.int64) + lt).tolist())
 			return self
 		else:
 			return NotImplemented
@@ -966,18 +1014,15 @@ class Web(Container):
 		''' merge points with the merge dictionnary {src index: dst index}
 			remaining points are not removed
 		'''
-		i = 0
-		while i < len(self.edges):
-			e = self.edges[i]
-			self.edges[i] = e = (
-				merges.get(e[0], e[0]),
-				merges.get(e[1], e[1]),
-				)
-			if e[0] == e[1]:
-				self.edges.pop(i)
-				self.tracks.pop(i)
-			else:
-				i += 1
+		if not self.edges:	return
+		edges = indexarray(self.edges, 2)
+		if merges:
+			remap = np.arange(max(edges.max(), max(merges))+1)
+			remap[np.fromiter(merges.keys(), np.int64, len(merges))] = np.fromiter(merges.values(), np.int64, len(merges))
+			edges = remap[edges]
+		keep = edges[:,0] != edges[:,1]
+		self.edges = list(zip(*edges[keep].T.tolist()))
+		self.tracks = np.array(self.tracks)[keep].tolist()
 	
 	def strippoints(self, used=None):
 		''' remove points that are used by no edges, return the reindex list.
@@ -985,28 +1030,21 @@ class Web(Container):
 			
 			return a table of the reindex made
 		'''
+		edges = indexarray(self.edges, 2)
 		if used is None:
-			used = [False] * len(self.points)
-			for edge in self.edges:
-				for p in edge:
-					used[p] = True
-		self.points = copy(self.points)
-		self.edges = copy(self.edges)
+			used = np.zeros(len(self.points), dtype=bool)
+			used[edges.reshape(-1)] = True
+		self.points = self.points[:]
 		reindex = striplist(self.points, used)
-		for i,e in enumerate(self.edges):
-			self.edges[i] = (reindex[e[0]], reindex[e[1]])
+		self.edges = list(zip(*np.asarray(reindex, dtype=np.int64)[edges].T.tolist()))
 		return reindex
 		
 	# --- verification methods ---
 			
 	def isline(self):
 		''' true if each point is used at most 2 times by edges '''
-		reached = [0] * len(self.points)
-		for line in self.edges:
-			for p in line:	reached[p] += 1
-		for r in reached:
-			if r > 2:	return False
-		return True
+		if not self.edges:	return True
+		return int(np.bincount(indexarray(self.edges, 2).reshape(-1)).max()) <= 2
 	
 	def isloop(self):
 		''' true if the wire form a loop '''
@@ -1015,11 +1053,13 @@ class Web(Container):
 	def check(self):
 		''' check that the internal data references are good (indices and list lengths) '''
 		l = len(self.points)
-		for line in self.edges:
-			for p in line:
-				if p >= l:	raise MeshError("some indices are greater than the number of points", line, l)
-				if p < 0:	raise MeshError("point indices must be positive", line)
-			if line[0] == line[1]:	raise MeshError("some edges use the same point multiple times", line)
+		edges = indexarray(self.edges, 2)
+		wrong = np.flatnonzero((edges >= l).any(axis=1))
+		if len(wrong):	raise MeshError("some indices are greater than the number of points", self.edges[wrong[0]], l)
+		wrong = np.flatnonzero((edges < 0).any(axis=1))
+		if len(wrong):	raise MeshError("point indices must be positive", self.edges[wrong[0]])
+		wrong = np.flatnonzero(edges[:,0] == edges[:,1])
+		if len(wrong):	raise MeshError("some edges use the same point multiple times", self.edges[wrong[0]])
 		if len(self.edges) != len(self.tracks):	raise MeshError("tracks list doesn't match edge list length")
 		if max(self.tracks, default=-1) >= len(self.groups): raise MeshError("some line group indices are greater than the number of groups", max(self.tracks, default=-1), len(self.groups))
 		
@@ -1029,12 +1069,9 @@ class Web(Container):
 		''' return the points that are used once only (so at wire terminations)
 			1D equivalent of Mesh.outlines()
 		'''
-		extr = set()
-		for l in self.edges:
-			for p in l:
-				if p in extr:	extr.remove(p)
-				else:			extr.add(p)
-		return extr
+		# points used an odd number of times
+		count = np.bincount(indexarray(self.edges, 2).reshape(-1))
+		return set(np.flatnonzero(count & 1).tolist())
 	
 	def groupextremities(self):
 		''' return the extremities of each group.
@@ -1078,7 +1115,8 @@ class Web(Container):
 			for p in edge:
 				if p in belong:
 					if belong[p] != track:
-						g = edgekey(belong[p],track)
+						x = belong[p]
+						g = (x,track) if x < track else (track,x)
 						indices.append(p)
 						tracks.append(couples.setdefault(g, len(couples)))
 					del belong[p]
@@ -1092,62 +1130,52 @@ class Web(Container):
 		if isinstance(groups, set):			pass
 		elif hasattr(groups, '__iter__'):	groups = set(groups)
 		else:								groups = (groups,)
-		edges = []
-		tracks = []
-		for f,t in zip(self.edges, self.tracks):
-			if t in groups:
-				edges.append(f)
-				tracks.append(t)
-		return Web(self.points, edges, tracks, self.groups)
+		selected = [t in groups  for t in self.tracks]
+		return Web(self.points, list(compress(self.edges, selected)), list(compress(self.tracks, selected)), self.groups)
 		
 	def islands(self) -> '[Web]':
 		''' return the unconnected parts of the mesh as several meshes '''
-		conn = Asso(	[(e[0],i)  for i,e in enumerate(self.edges)]
-					+	[(e[1],i)  for i,e in enumerate(self.edges)])
-		# propagation
-		islands = []
-		reached = [False] * len(self.edges)	# edges reached
-		stack = []
-		start = 0
-		while True:
-			# search start point
-			for start in range(start,len(reached)):
-				if not reached[start]:
-					stack.append(start)
-					break
-			# end when everything reached
-			if not stack:	break
-			# propagate
-			island = Web(self.points, [], [], self.groups)
-			while stack:
-				i = stack.pop()
-				if reached[i]:	continue	# make sure this face has not been stacked twice
-				reached[i] = True
-				island.edges.append(self.edges[i])
-				island.tracks.append(self.tracks[i])
-				for p in self.edges[i]:
-					stack.extend(n	for n in conn[p] if not reached[n])
-			islands.append(island)
-		return islands
+		# union-find of the points, connected by the edges
+		parent = list(range(len(self.points)))
+		rank = [0] * len(self.points)
+		def find(p):
+			root = p
+			while parent[root] != root:
+				root = parent[root]
+			while parent[p] != root:
+				parent[p], p = root, parent[p]
+			return root
+		for a,b in self.edges:
+			a, b = find(a), find(b)
+			if a == b:	continue
+			if rank[a] < rank[b]:	a, b = b, a
+			parent[b] = a
+			if rank[a] == rank[b]:	rank[a] += 1
+		# bucket the edges by root, islands are sorted by their first edge
+		buckets = {}
+		for i,e in enumerate(self.edges):
+			buckets.setdefault(find(e[0]), []).append(i)
+		return [Web(self.points, 
+					[self.edges[i]  for i in bucket], 
+					[self.tracks[i]  for i in bucket], 
+					self.groups)
+				for bucket in buckets.values()]
 	
 	def length(self):
 		''' total length of edges '''
-		s = 0
-		for a,b in lineedges(self):
-			s += distance(self.points[a], self.points[b])
-		return s
+		if not self.edges:	return 0
+		points = glmarray(self.points, None)
+		edges = indexarray(self.edges, 2)
+		return float(np.linalg.norm(points[edges[:,1]] - points[edges[:,0]], axis=1).sum())
 	
 	def barycenter(self):
 		''' curve barycenter of the mesh '''
 		if not self.edges:	return vec3(0)
-		acc = vec3(0)
-		tot = 0
-		for e in self.edges:
-			a,b = self.edgepoints(e)
-			weight = distance(a,b)
-			tot += weight
-			acc += weight*(a+b)
-		return acc / (2*tot)
+		points = glmarray(self.points, None)
+		edges = indexarray(self.edges, 2)
+		a, b = points[edges[:,0]], points[edges[:,1]]
+		weight = np.linalg.norm(b-a, axis=1)
+		return vec3(*((a+b) * weight[:,None]).sum(axis=0) / (2*weight.sum()))
 	
 	def arcs(self):
 		''' return the contiguous portions of this web '''
@@ -1177,26 +1205,23 @@ class Web(Container):
 		idents = []
 		edges = []
 		frontiers = []
-		def usept(pi, ident, used):
-			if used[pi] >= 0:	
-				return used[pi]
-			else:
-				used[pi] = i = len(points)
-				points.append(self.points[pi])
-				idents.append(ident)
-				return i
 		
+		# edges sorted by group
+		alledges = indexarray(self.edges, 2)
+		tracks = np.asarray(self.tracks, dtype=np.int64)
+		order = np.argsort(tracks, kind='stable')
+		bounds = np.searchsorted(tracks[order], np.arange(len(self.groups)+1)).tolist()
 		for group in range(len(self.groups)):
-			used = [-1]*len(self.points)
-			frontier = set()
-			for edge,track in zip(self.edges, self.tracks):
-				if track != group:	continue
-				edges.append((usept(edge[0], track, used), usept(edge[1], track, used)))
-				for p in edge:
-					if p in frontier:	frontier.remove(p)
-					else:				frontier.add(p)
-			for p in frontier:
-				frontiers.append(used[p])
+			groupedges = alledges[order[bounds[group]:bounds[group+1]]]
+			# each point used by the group is duplicated for the group
+			used, inverse = np.unique(groupedges.reshape(-1), return_inverse=True)
+			inverse = inverse.reshape(-1)
+			base = len(points)
+			points.extend([self.points[p]  for p in used.tolist()])
+			idents.extend([group] * len(used))
+			edges.extend(zip(*(inverse.reshape(-1,2) + base).T.tolist()))
+			# points used an odd number of times in the group
+			frontiers.extend((np.flatnonzero(np.bincount(inverse, minlength=len(used)) & 1) + base).tolist())
 				
 		if not points or not edges:
 			return displays.Display()
@@ -1210,12 +1235,44 @@ class Web(Container):
 
 
 def glmarray(array, dtype='f4'):
-	''' create a numpy array from a list of glm vec '''
-	buff = np.array(glm.array(array), copy=False)
+	''' create a numpy array from a list of glm vec 
+		the precision is reduced to 32 bits, unless `dtype` is None
+		
+		numpy arrays and glm arrays are used without conversion through a list
+	'''
+	if isinstance(array, (np.ndarray, glm.array)):		buff = np.asarray(array)
+	else:												buff = np.asarray(glm.array(array))
+	if dtype is None:	return buff
 	if buff.dtype == np.float64:	buff = buff.astype(np.float32)
 	elif buff.dtype == np.int64:	buff = buff.astype(np.int32)
 	return buff
 
+def indexarray(indices, width, dtype=np.int64):
+	''' create a numpy array of shape (N,width) from a list of index tuples (like faces or edges) 
+		an array is only reshaped and converted if necessary
+	'''
+	if isinstance(indices, np.ndarray):
+		return indices.astype(dtype, copy=False).reshape(-1, width)
+	return np.fromiter(chain.from_iterable(indices), dtype, width*len(indices)).reshape(-1, width)
+
+def faceedges(faces):
+	''' array of shape (3*N,2) of the ORIENTED edges of each face of an array of faces, in the face order '''
+	return faces[:, [0,1,1,2,2,0]].reshape(-1,2)
+
+def unitarray(vectors):
+	''' normalize each vector of an array of shape (N,3), null vectors get nan '''
+	return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+def trinormals(points, faces):
+	''' array of the normals of each face, from an array of points and an array of faces 
+		degenerated faces get nan normals
+	'''
+	a, b, c = points[faces[:,0]], points[faces[:,1]], points[faces[:,2]]
+	normals = np.cross(b-a, c-a)
+	with np.errstate(invalid='ignore', divide='ignore'):
+		normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+	return normals
+
 def web(*arg):
 	''' Build a web object from supported objects:
 	
@@ -1239,9 +1296,9 @@ def web(*arg):
 	elif hasattr(arg, 'mesh'):
 		return web(arg.mesh())
 	elif isinstance(arg, list) and isinstance(arg[0], vec3):
-		return Web(arg, [(i,i+1) for i in range(len(arg)-1)])
+		return Web(arg, list(zip(range(len(arg)-1), range(1, len(arg)))))
 	elif isinstance(arg, tuple) and isinstance(arg[0], vec3):
-		return Web(list(arg), [(i,i+1) for i in range(len(arg)-1)])
+		return Web(list(arg), list(zip(range(len(arg)-1), range(1, len(arg)))))
 	elif hasattr(arg, '__iter__'):
 		pool = Web()
 		for primitive in arg:
@@ -1322,12 +1379,20 @@ class Wire(Container):
 		if limit is None:	limit = self.precision()
 		limit *= limit
 		merges = {}
-		for i in reversed(range(1, len(self.indices))):
-			if distance2(self[i-1], self[i]) <= limit:
-				merges[self.indices[i]] = self.indices[i-1]
-				self.indices.pop(i)
+		if len(self.indices) > 1:
+			# removing a point does not change the distances between the preceding ones, so all distances are computed at once
+			points = glmarray(self.points, None)[np.asarray(self.indices, dtype=np.int64)]
+			close = np.flatnonzero(np.square(points[1:] - points[:-1]).sum(axis=1) <= limit) + 1
+			if len(close):
+				for i in reversed(close.tolist()):
+					merges[self.indices[i]] = self.indices[i-1]
+				keep = np.ones(len(self.indices), dtype=bool)
+				keep[close] = False
+				self.indices[:] = compress(self.indices, keep.tolist())
 				if self.tracks:
-					self.tracks.pop(i-1)
+					keep = np.ones(len(self.tracks), dtype=bool)
+					keep[close-1] = False
+					self.tracks[:] = compress(self.tracks, keep.tolist())
 		if distance2(self[0], self[-1]) < limit:
 			merges[self.indices[-1]] = self.indices[0]
 			self.indices[-1] = self.indices[0]
@@ -1344,8 +1409,8 @@ class Wire(Container):
 	def check(self):
 		''' raise if the internal data are not consistent '''
 		l = len(self.points)
-		for i in self.indices:
-			if i >= l:	raise MeshError("some indices are greater than the number of points", i, l)
+		wrong = np.flatnonzero(np.asarray(self.indices, dtype=np.int64) >= l)
+		if len(wrong):	raise MeshError("some indices are greater than the number of points", self.indices[wrong[0]], l)
 		if self.tracks:
 			if len(self.indices) != len(self.tracks):	raise MeshError("tracks list doesn't match indices list length")
 			if max(self.tracks) >= len(self.groups):	raise MeshError("some tracks are greater than the number of groups", max(self.tracks), len(self.groups))
@@ -1355,28 +1420,23 @@ class Wire(Container):
 		return (self.indices[i], self.indices[i+1])
 	def edges(self):
 		''' list of successive edges of the wire '''
-		return [self.edge(i)  for i in range(len(self.indices)-1)]
+		return list(zip(self.indices, self.indices[1:]))
 	
 	
 	def length(self):
 		''' curviform length of the wire (sum of all edges length) '''
-		s = 0
-		for i in range(1,len(self.indices)):
-			s += distance(self[i-1], self[i])
-		return s
+		if len(self.indices) < 2:	return 0
+		points = glmarray(self.points, None)[np.asarray(self.indices, dtype=np.int64)]
+		return float(np.linalg.norm(points[1:] - points[:-1], axis=1).sum())
 		
 	def barycenter(self):
 		''' curve barycenter '''
 		if not self.indices:	return vec3(0)
 		if len(self.indices) == 1:	return self.points[self.indices[0]]
-		acc = vec3(0)
-		tot = 0
-		for i in range(1,len(self)):
-			a,b = self[i-1], self[i]
-			weight = distance(a,b)
-			tot += weight
-			acc += weight*(a+b)
-		return acc / (2*tot)
+		points = glmarray(self.points, None)[np.asarray(self.indices, dtype=np.int64)]
+		a, b = points[:-1], points[1:]
+		weight = np.linalg.norm(b-a, axis=1)
+		return vec3(*((a+b) * weight[:,None]).sum(axis=0) / (2*weight.sum()))
 			
 		
 	def barycenter_points(self):
@@ -1388,10 +1448,10 @@ class Wire(Container):
 			this is called normal because it would be the normal to a surface whose section would be that wire
 		'''
 		# TODO: solve the problem of consecutive same points (occurs for instance with loops)
-		normals = [None] * len(self.indices)
-		for i in range(len(self.indices)):
-			a,b,c = self.indices[i-2], self.indices[i-1], self.indices[i]
-			normals[i-1] = normalize(normalize(self.points[b]-self.points[a]) + normalize(self.points[b]-self.points[c]))
+		points = glmarray(self.points, None)[np.asarray(self.indices, dtype=np.int64)]
+		with np.errstate(invalid='ignore', divide='ignore'):
+			normals = unitarray(unitarray(points - np.roll(points, 1, axis=0)) + unitarray(points - np.roll(points, -1, axis=0)))
+		normals = [vec3(*n)  for n in normals.tolist()]
 		self._make_loop_consistency(normals, loop)
 		return normals
 		
@@ -1400,10 +1460,10 @@ class Wire(Container):
 			if this is not a loop the result is undefined.
 		'''
 		# TODO: solve the problem of consecutive same points (occurs for instance with loops)
-		tangents = [None] * len(self.indices)
-		for i in range(len(self.indices)):
-			a,b,c = self.indices[i-2], self.indices[i-1], self.indices[i]
-			tangents[i-1] = normalize(cross(self.points[b]-self.points[a], self.points[b]-self.points[c]))
+		points = glmarray(self.points, None)[np.asarray(self.indices, dtype=np.int64)]
+		with np.errstate(invalid='ignore', divide='ignore'):
+			tangents = unitarray(np.cross(points - np.roll(points, 1, axis=0), points - np.roll(points, -1, axis=0)))
+		tangents = [vec3(*t)  for t in tangents.tolist()]
 		self._make_loop_consistency(tangents, loop)
 		return tangents
 	
@@ -1416,9 +1476,13 @@ class Wire(Container):
 			i = max(self.indices, key=lambda i: dot(self.points[i], dir))
 			# propagation reorient
 			# WARNING: if there is a cusp in the curve (2 consecutive segments with opposite directions) the final result can be wrong
+			points = glmarray(self.points, None)[np.asarray(self.indices, dtype=np.int64)]
+			with np.errstate(invalid='ignore', divide='ignore'):
+				directions = unitarray(points - np.roll(points, 1, axis=0))
+			directions = [vec3(*e)  for e in directions.tolist()]
 			for i in range(i+1, i+l):
 				j = i%l
-				e = normalize(self[j]-self[j-1])
+				e = directions[j]
 				if dot(noproject(normals[j],e), noproject(normals[j-1],e)) < 0:
 					normals[j] = -normals[j]
 		# propagate to borders if not loop
@@ -1607,14 +1671,17 @@ class jitmap(object):
 		
 def edgekey(a,b):
 	''' return a key for a non-directional edge '''
-	if a < b:	return (a,b)
-	else:		return (b,a)
+	return (a,b) if a < b else (b,a)
+	
+def packedges(edges, n):
+	''' pack an array of UNORIENTED edges of shape (N,2) into int64 keys `min*n + max`, `n` being the number of points '''
+	return edges.min(axis=1) * n + edges.max(axis=1)
 	
 def facekeyo(a,b,c):
-	''' return a key for an oriented face '''
-	if a < b and b < c:		return (a,b,c)
-	elif a < b:				return (c,a,b)
-	else:					return (b,c,a)
+	''' return a key for an oriented face, the rotation starting with its smallest index '''
+	if a < b and a < c:		return (a,b,c)
+	elif b < c:				return (b,c,a)
+	else:					return (c,a,b)
 	
 def arrangeface(f, p):
 	''' return the face indices rotated the way the `p` is the first one '''
@@ -1647,19 +1714,22 @@ def connef(faces):
 	return conn
 	
 def connpe(edges):
+	''' point to edge connectivity, as an `Asso` {point: edge index} '''
+	points = indexarray(edges, 2).reshape(-1)
+	# rank of each occurence of a point, as Asso.add would give it, found by sorting the points
+	order = np.argsort(points, kind='stable')
+	rank = np.empty(len(points), dtype=np.int64)
+	rank[order] = np.arange(len(points)) - np.searchsorted(points[order], points[order])
 	conn = Asso()
-	for i,edge in enumerate(edges):
-		for p in edge:
-			conn.add(p,i)
+	conn._table = dict(zip(
+			zip(rank.tolist(), points.tolist()), 
+			(np.arange(len(points)) // 2).tolist(),
+			))
 	return conn
 
 def connexity(links):
 	''' return the number of links referencing each point as a dictionnary {point: num links} '''
-	reach = {}
-	for l in links:
-		for p in l:
-			reach[p] = reach.get(p,0) +1
-	return reach
+	return Counter(chain.from_iterable(links))
 		
 
 def lineedges(line, closed=False):
@@ -1684,9 +1754,10 @@ def line_simplification(web, prec=None):
 	
 	# simplify points when it forms triangles with too small height
 	merges = {}
-	def process(a,b,c):
+	def process(a,b,c, height=None):
 		# merge with current merge point if height is not sufficient, use it as new merge point
-		height = length(noproject(pts[c]-pts[b], pts[c]-pts[a]))
+		if height is None:
+			height = length(noproject(pts[c]-pts[b], pts[c]-pts[a]))
 		if height > prec:
 			#scn3D.add(text.Text(pts[b], str(height), 8, (1,0,1), align=('left', 'center')))
 			return b
@@ -1694,10 +1765,17 @@ def line_simplification(web, prec=None):
 			merges[b] = a
 			return a
 	
+	buff = glmarray(pts, None)  if pts else np.empty((0,3))
 	for k,line in enumerate(suites(web.edges, oriented=False)):
+		# heights of the triangles formed by successive points, valid as long as no point was merged just before
+		if len(line) > 2:
+			p = buff[np.asarray(line, dtype=np.int64)]
+			a, b, c = p[:-2], p[1:-1], p[2:]
+			with np.errstate(invalid='ignore', divide='ignore'):
+				heights = (np.linalg.norm(np.cross(c-b, c-a), axis=1) / np.linalg.norm(c-a, axis=1)).tolist()
 		s = line[0]
 		for i in range(2, len(line)):
-			s = process(s, line[i-1], line[i])
+			s = process(s, line[i-1], line[i], heights[i-2] if s == line[i-2] else None)
 		if line[0]==line[-1]: process(s, line[0], line[1])
 		
 	# remove redundancies in merges (there can't be loops in merges)
@@ -1718,32 +1796,46 @@ def suites(lines, oriented=True, cut=True, loop=False):
 		return a list of the sequences that can be formed
 	'''
 	lines = list(lines)
+	# index the lines by their first and last point, in decreasing order so the first unused line is at the end
+	heads, tails = {}, {}
+	for i in reversed(range(len(lines))):
+		heads.setdefault(lines[i][0], []).append(i)
+		tails.setdefault(lines[i][-1], []).append(i)
+	used = bytearray(len(lines))
+	def firstunused(table, p):
+		candidates = table.get(p)
+		if not candidates:	return None
+		while candidates and used[candidates[-1]]:
+			candidates.pop()
+		return candidates[-1] if candidates else None
 	# get contiguous suite of points
 	suites = []
-	while lines:
-		suite = list(lines.pop())
-		found = True
-		while found:
-			found = False
-			for i,edge in enumerate(lines):
-				if edge[-1] == suite[0]:		suite[0:1] = edge
-				elif edge[0] == suite[-1]:		suite[-1:] = edge
-				# for unoriented lines
-				elif not oriented and edge[0] == suite[0]:		suite[0:1] = reversed(edge)
-				elif not oriented and edge[-1] == suite[-1]:	suite[-1:] = reversed(edge)
-				else:
-					continue
-				lines.pop(i)
-				found = True
-				break
+	last = len(lines)-1
+	while True:
+		while last >= 0 and used[last]:	last -= 1
+		if last < 0:	break
+		used[last] = True
+		suite = list(lines[last])
+		while True:
+			# the first remaining line that can extend the suite
+			candidates = [firstunused(tails, suite[0]), firstunused(heads, suite[-1])]
+			if not oriented:
+				candidates += [firstunused(heads, suite[0]), firstunused(tails, suite[-1])]
+			candidates = [i  for i in candidates if i is not None]
+			if not candidates:	break
+			i = min(candidates)
+			edge = lines[i]
+			if edge[-1] == suite[0]:		suite[0:1] = edge
+			elif edge[0] == suite[-1]:		suite[-1:] = edge
+			# for unoriented lines
+			elif edge[0] == suite[0]:		suite[0:1] = reversed(edge)
+			else:							suite[-1:] = reversed(edge)
+			used[i] = True
 			if loop and suite[-1] == suite[0]:	break
 		suites.append(suite)
 	# cut at suite intersections (sub suites or crossing suites)
 	if cut:
-		reach = {}
-		for suite in suites:
-			for p in suite:
-				reach[p] = reach.get(p,0) + 1
+		reach = Counter(chain.from_iterable(suites))
 		for suite in suites:
 			for i in range(1,len(suite)-1):
 				if reach[suite[i]] > 1:
@@ -1753,87 +1845,72 @@ def suites(lines, oriented=True, cut=True, loop=False):
 	return suites
 	
 
-def distance2_pm(point, mesh) -> '(d, prim)':
-	''' squared distance from a point to a mesh
-	'''
-	if isinstance(mesh, Mesh):
-		def analyse():
-			for face in mesh.faces:
-				f = mesh.facepoints(face)
-				n = cross(f[1]-f[0], f[2]-f[0])
-				if not n:	continue
-				# check if closer to the triangle's edges than to the triangle plane
-				plane = True
-				for i in range(3):
-					d = f[i-1]-f[i-2]
-					if dot(cross(n, d), point-f[i-2]) < 0:
-						x = dot(point-f[i-2], d) / length2(d)
-						# check if closer to the edge points than to the edge axis
-						if x < 0:	yield distance2(point, f[i-2]), face[i-2]
-						elif x > 1:	yield distance2(point, f[i-1]), face[i-1]
-						else:		yield length2(noproject(point - f[i-2], d)), (face[i-2], face[i-1])
-						plane = False
-						break
-				if plane:
-					yield dot(point-f[0], n) **2 / length2(n), face
-	elif isinstance(mesh, (Web,Wire)):
-		def analyse():
-			if isinstance(mesh, Web):	edges = mesh.edges
-			else:						edges = mesh.edges()
-			for edge in edges:
-				e = mesh.edgepoints(edge)
-				d = e[1]-e[0]
-				x = dot(point - e[0], d) / length2(d)
-				# check if closer to the edge points than to the edge axis
-				if x < 0:	yield distance2(point, e[0]), e[0]
-				elif x > 1:	yield distance2(point, e[1]), e[1]
-				else:		yield length2(noproject(point - e[0], d)), e
-	elif isinstance(mesh, vec3):
-		return distance2(point, mesh), 0
-	else:
-		raise TypeError('cannot evaluate distance from vec3 to {}'.format(type(mesh)))
-	return min(analyse(), key=lambda t:t[0])
-	
-	
 def distance2_pm(point, mesh) -> '(d, prim)':
 	''' squared distance from a point to a mesh
 	'''
 	score = inf
 	best = None
 	if isinstance(mesh, Mesh):
-		for face in mesh.faces:
-			f = mesh.facepoints(face)
-			n = cross(f[1]-f[0], f[2]-f[0])
-			if not n:	continue
-			# check if closer to the triangle's edges than to the triangle plane
-			plane = True
+		if not mesh.faces:	return score, best
+		faces = indexarray(mesh.faces, 3)
+		f = glmarray(mesh.points, None)[faces]
+		p = np.array(tuple(point), dtype=f.dtype)
+		n = np.cross(f[:,1]-f[:,0], f[:,2]-f[:,0])
+		n2 = (n*n).sum(axis=1)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			# distance to the triangle plane
+			dist = ((p-f[:,0])*n).sum(axis=1) **2 / n2
+			kind = np.zeros(len(faces), dtype=np.int8)	# 0 for the plane, 1 for an edge origin, 2 for an edge end, 3 for an edge axis
+			edge = np.zeros(len(faces), dtype=np.int8)
+			# check if closer to the triangle's edges than to the triangle plane, the first edge outside is retained
+			plane = np.ones(len(faces), dtype=bool)
 			for i in range(3):
-				d = f[i-1]-f[i-2]
-				if dot(cross(n, d), point-f[i-2]) < 0:
-					x = dot(point-f[i-2], d) / length2(d)
-					# check if closer to the edge points than to the edge axis
-					if x < 0:	dist, candidate = distance2(point, f[i-2]), face[i-2]
-					elif x > 1:	dist, candidate = distance2(point, f[i-1]), face[i-1]
-					else:		dist, candidate = length2(noproject(point - f[i-2], d)), (face[i-2], face[i-1])
-					plane = False
-					break
-			if plane:
-				dist, candidate = dot(point-f[0], n) **2 / length2(n), face
-			if dist < score:
-				best, score = candidate, dist
+				o, e = f[:,i-2], f[:,i-1]
+				d = e - o
+				v = p - o
+				outside = plane & (((np.cross(n, d)*v).sum(axis=1)) < 0)
+				plane &= ~outside
+				d2 = (d*d).sum(axis=1)
+				x = (v*d).sum(axis=1) / d2
+				# check if closer to the edge points than to the edge axis
+				axis = v - x[:,None]*d
+				edist = np.where(x < 0, (v*v).sum(axis=1), 
+						np.where(x > 1, ((p-e)**2).sum(axis=1), 
+						(axis*axis).sum(axis=1)))
+				dist = np.where(outside, edist, dist)
+				kind = np.where(outside, np.where(x < 0, 1, np.where(x > 1, 2, 3)), kind)
+				edge = np.where(outside, i, edge)
+		# degenerated faces are skipped
+		dist[(n2 == 0) | np.isnan(dist)] = inf
+		j = int(np.argmin(dist))
+		if dist[j] < score:
+			face = mesh.faces[j]
+			i = int(edge[j])
+			score = float(dist[j])
+			best = (face, face[i-2], face[i-1], (face[i-2], face[i-1]))[kind[j]]
 	elif isinstance(mesh, (Web,Wire)):
 		if isinstance(mesh, Web):	edges = mesh.edges
 		else:						edges = mesh.edges()
-		for edge in edges:
-			e = mesh.edgepoints(edge)
-			d = e[1]-e[0]
-			x = dot(point - e[0], d) / length2(d)
+		if not edges:	return score, best
+		e = glmarray(mesh.points, None)[indexarray(edges, 2)]
+		p = np.array(tuple(point), dtype=e.dtype)
+		d = e[:,1] - e[:,0]
+		v = p - e[:,0]
+		with np.errstate(invalid='ignore', divide='ignore'):
+			x = (v*d).sum(axis=1) / (d*d).sum(axis=1)
 			# check if closer to the edge points than to the edge axis
-			if x < 0:	dist, candidate = distance2(point, e[0]), edge[0]
-			elif x > 1:	dist, candidate = distance2(point, e[1]), edge[1]
-			else:		dist, candidate = length2(noproject(point - e[0], d)), edge
-			if dist < score:
-				best, score = candidate, dist
+			axis = v - x[:,None]*d
+			dist = np.where(x < 0, (v*v).sum(axis=1), 
+					np.where(x > 1, ((p-e[:,1])**2).sum(axis=1), 
+					(axis*axis).sum(axis=1)))
+		dist[np.isnan(dist)] = inf
+		j = int(np.argmin(dist))
+		if dist[j] < score:
+			edge = edges[j]
+			score = float(dist[j])
+			if x[j] < 0:	best = edge[0]
+			elif x[j] > 1:	best = edge[1]
+			else:			best = edge
 	elif isinstance(mesh, vec3):
 		return distance2(point, mesh), 0
 	else:
@@ -1854,24 +1931,24 @@ def mesh_distance(m0, m1) -> '(d, prim0, prim1)':
 	def analyse(m, o):
 		# get an iterator over actually used points only
 		if isinstance(m, Mesh):
-			usage = [False]*len(m.points)
-			for f in m.faces:
-				for p in f:	usage[p] = True
-			it = (i for i,u in enumerate(usage) if u)
+			usage = np.zeros(len(m.points), dtype=bool)
+			usage[indexarray(m.faces, 3).reshape(-1)] = True
+			it = np.flatnonzero(usage).tolist()
 		elif isinstance(m, Web):
-			usage = [False]*len(m.points)
-			for e in m.edges:
-				for p in e:	usage[p] = True
-			it = (i for i,u in enumerate(usage) if u)
+			usage = np.zeros(len(m.points), dtype=bool)
+			usage[indexarray(m.edges, 2).reshape(-1)] = True
+			it = np.flatnonzero(usage).tolist()
 		elif isinstance(m, Wire):
 			it = m.indices
 		elif isinstance(m, vec3):
 			return (*distance2_pm(m, o), 0)
 		# comfront to the mesh
-		return min((
-				(*distance2_pm(m.points[i], o), i)
-				for i in it), 
-				key=lambda t:t[0])
+		best = None
+		for i in it:
+			d, prim = distance2_pm(m.points[i], o)
+			if best is None or d < best[0]:
+				best = d, prim, i
+		return best
 	# symetrical evaluation
 	d0 = analyse(m0, m1)
 	d1 = analyse(m1, m0)
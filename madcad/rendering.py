@@ -36,11 +36,14 @@
 				QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
 '''
 
-from copy import copy, deepcopy
+from copy import copy
+from functools import lru_cache
+from operator import itemgetter
+from bisect import bisect_left
 import traceback
 
 import moderngl as mgl
-import numpy.core as np
+import numpy as np
 
 from PyQt5.QtCore import Qt, QPoint, QEvent
 from PyQt5.QtWidgets import QOpenGLWidget, QApplication
@@ -102,6 +105,7 @@ class Display:
 		
 			world(fmat4):  matrix from local space to parent space
 			box(Box):      boudingbox of the display in local space
+			cullable(bool):  True if everything the display draws is inside its box, so it can be skipped when its box is out of view
 			
 			These attributes are variable members by default but can be overriden as properties if needed.
 	'''
@@ -110,6 +114,7 @@ class Display:
 	
 	box = Box(center=0, width=fvec3(-inf))	# to inform the scene and the view of the object size
 	world = fmat4(1)		# set by the display containing this one if it is belonging to a group
+	cullable = False		# displays drawing outside their box must never be culled
 	
 	def display(self, scene) -> 'self':
 		''' displays are obviously displayable as themselves '''
@@ -267,6 +272,7 @@ class Turntable:
 		self.pitch = pitch
 		self.distance = distance
 		self.tool = navigation_tool
+		self._matrix = (None, None)	# last computed matrix with its parameters
 		
 	def rotate(self, dx, dy, dz):
 		self.yaw += dx*pi
@@ -280,11 +286,14 @@ class Turntable:
 		self.distance *= f
 	
 	def matrix(self) -> fmat4:
-		# build rotation from view euler angles
-		rot = inverse(fquat(fvec3(pi/2-self.pitch, 0, -self.yaw)))
-		mat = translate(mat4_cast(rot), -self.center)
-		mat[3][2] -= self.distance
-		return mat
+		key = (self.yaw, self.pitch, self.distance, tuple(self.center))
+		if key != self._matrix[0]:
+			# build rotation from view euler angles
+			rot = inverse(fquat(fvec3(pi/2-self.pitch, 0, -self.yaw)))
+			mat = translate(mat4_cast(rot), -self.center)
+			mat[3][2] -= self.distance
+			self._matrix = (key, mat)
+		return fmat4(self._matrix[1])
 
 class Orbit:
 	''' navigation rotating on the 3 axis around a center.
@@ -296,6 +305,7 @@ class Orbit:
 		self.distance = float(distance)
 		self.orient = fquat(orient)
 		self.tool = navigation_tool
+		self._matrix = (None, None)	# last computed matrix with its parameters
 		
 	def rotate(self, dx, dy, dz):
 		# rotate from view euler angles
@@ -307,9 +317,12 @@ class Orbit:
 		self.distance *= f
 	
 	def matrix(self) -> fmat4:
-		mat = translate(mat4_cast(self.orient), -self.center)
-		mat[3][2] -= self.distance
-		return mat
+		key = (tuple(self.orient), self.distance, tuple(self.center))
+		if key != self._matrix[0]:
+			mat = translate(mat4_cast(self.orient), -self.center)
+			mat[3][2] -= self.distance
+			self._matrix = (key, mat)
+		return fmat4(self._matrix[1])
 
 
 class Perspective:
@@ -319,16 +332,20 @@ class Perspective:
 	'''
 	def __init__(self, fov=None):
 		self.fov = fov or settings.display['field_of_view']
+		self._matrix = (None, None)	# last computed matrix with its parameters
 	def matrix(self, ratio, distance) -> fmat4:
-		return perspective(self.fov, ratio, distance*1e-2, distance*1e4)
+		key = (self.fov, ratio, distance)
+		if key != self._matrix[0]:
+			self._matrix = (key, perspective(self.fov, ratio, distance*1e-2, distance*1e4))
+		return fmat4(self._matrix[1])
 
 class Orthographic:
 	''' object used as `View.projection` '''
 	def matrix(self, ratio, distance) -> fmat4:
-		return fmat4(1/ratio/distance, 0, 0, 0,
-		            0,       1/distance, 0, 0,
-		            0,       0,          1, 0,
-		            0,       0,          0, 1)
+		mat = fmat4(1)
+		mat[0][0] = 1/ratio/distance
+		mat[1][1] = 1/distance
+		return mat
 
 
 class Scene:
@@ -362,13 +379,15 @@ class Scene:
 		self.ressources = {}	# context-related ressources, shared across displays, but not across contexts (shaders, vertexarrays, ...)
 		
 		# rendering options
-		self.options = deepcopy(settings.scene)
+		self.options = copy(settings.scene)	# scene settings are flat, with immutable values
 		if options:	self.options.update(options)
 		
 		# render elements
 		self.queue = {}	# list of objects to display, not yet loaded on the GPU
 		self.displays = {} # displays created from the inserted objects, associated to their insertion key
 		self.stacks = {}	# dict of list of callables, that constitute the render pipeline:  (key,  priority, callable)
+		self._renderstacks = {}	# tuples of (root key, callable) in each stack, iterated at each render
+		self._nextkey = 0	# lowest integer key that might be unused, for automatic keys
 		self.setup = setup or {}	# callable for each target
 		
 		self.touched = False
@@ -381,8 +400,9 @@ class Scene:
 			the object is not added to the the renderpipeline yet, but queued for next rendering.
 		'''
 		if key is None:
-			for i in range(len(self.displays)+1):
-				if i not in self.displays:	key = i
+			key = self._nextkey
+			while key in self.displays or key in self.queue:	key += 1
+			self._nextkey = key+1
 		self.queue[key] = displayable
 		return key
 
@@ -401,7 +421,8 @@ class Scene:
 		for stack in self.stacks.values():
 			for i in reversed(range(len(stack))):
 				if stack[i][0][0] == key:
-					self.stacks.pop(i)
+					stack.pop(i)
+		self._compilestacks()
 					
 	def item(self, key):
 		''' get the Display associated with the given key, descending the parenting tree 
@@ -454,29 +475,65 @@ class Scene:
 					if len(frame) != 4:
 						raise ValueError('wrong frame format in the stack from {}\n\t got {}'.format(display, frame))
 					sub,target,priority,func = frame
-					if target not in self.stacks:	self.stacks[target] = []
-					stack = self.stacks[target]
-					stack.insert(
-								bisect(stack, priority, lambda s:s[1]), 
-								((key,*sub), priority, func))
+					self.stacks.setdefault(target, []).append(((key,*sub), priority, func))
+			# sort all frames at once, frames of same priority stay in insertion order
+			for stack in self.stacks.values():
+				stack.sort(key=itemgetter(1))
+			self._compilestacks()
 			self.touched = False
 	
-	def render(self, view):
-		''' render to the view targets. 
+	def _compilestacks(self):
+		''' update the callables iterated by render from the current stacks '''
+		self._renderstacks = {target: tuple((key[0], func)  for key,priority,func in stack)	
+								for target,stack in self.stacks.items()}
+	
+	def render(self, view, targets=None):
+		''' render to the view targets (or only to the given ones). 
 			
 			This must be called by the view widget, once the the opengl context is set.
 		'''
-		empty = ()
+		if targets is None:
+			targets = view.targets
 		with self.ctx:
 			# apply changes that need opengl runtime
 			self.dequeue()
 			# render everything
-			for target, frame, setup in view.targets:
+			stacks = self._renderstacks
+			culled = self.culled(view)  if self.options.get('frustum_culling')  else ()
+			for target, frame, setup in targets:
 				view.target = frame
 				frame.use()
 				setup()
-				for key, priority, func in self.stacks.get(target,empty):
-					func(view)
+				# the ident steps must be counted for every display, so the ident frame is never culled
+				if culled and target != 'ident':
+					for key, func in stacks.get(target, ()):
+						if key not in culled:
+							func(view)
+				else:
+					for key, func in stacks.get(target, ()):
+						func(view)
+	
+	def culled(self, view) -> set:
+		''' keys of the root displays whose box is entirely out of the view frustum 
+			
+			Only the cullable displays are culled, and never when their box is invalid.
+		'''
+		projview = view.uniforms['projview']
+		last = row(projview, 3)
+		planes = [last + row(projview, i)  for i in range(3)] + [last - row(projview, i)  for i in range(3)]
+		planes = [(fvec3(plane), abs(fvec3(plane)), plane.w)  for plane in planes]
+		culled = set()
+		for key, display in self.displays.items():
+			if not getattr(display, 'cullable', False):	continue
+			box = display.box
+			if not box.isvalid():	continue
+			box = box.transform(fmat4(display.world))
+			center, half = fvec3(box.center), fvec3(box.width)/2
+			for normal, absnormal, offset in planes:
+				if dot(normal, center) + dot(absnormal, half) + offset < 0:
+					culled.add(key)
+					break
+		return culled
 	
 	def box(self):
 		''' computes the boundingbox of the scene, with the current object poses '''
@@ -615,6 +672,11 @@ class Group(Display):
 		for display in self.displays.values():
 			box.union_update(display.box)
 		return box.transform(self._pose)
+	
+	@property
+	def cullable(self):
+		''' a group can be culled only if all its displays can '''
+		return all(getattr(display, 'cullable', False)	for display in self.displays.values())
 
 
 # dictionnary to store procedures to override default object displays
@@ -665,9 +727,8 @@ class View(QOpenGLWidget):
 		self.stepi = 0
 		
 		# dump targets
-		self.map_depth = None
-		self.map_idents = None
 		self.fresh = set()	# set of refreshed internal variables since the last render
+		self.fresh_areas = {}	# areas of the dump targets read since the last render
 	
 	# -- internal frame system --
 	
@@ -681,24 +742,27 @@ class View(QOpenGLWidget):
 		self.fb_ident = ctx.simple_framebuffer((w,h), components=3, dtype='f1')
 		self.targets = [ ('screen', self.fb_screen, self.setup_screen), 
 						 ('ident', self.fb_ident, self.setup_ident)]
-		self.map_ident = np.empty((h,w), dtype='u2')
-		self.map_depth = np.empty((h,w), dtype='f4')
 		
-	def refreshmaps(self):
-		''' load the rendered frames from the GPU to the CPU 
+	def readmaps(self, x, y, w, h):
+		''' load only a rectangle of the rendered frames from the GPU to the CPU, and return its ident and depth maps
 			
-			- When a picture is used to GPU rendering it's called 'frame'
-			- When it is dumped to the RAM we call it 'map' in this library
+			The rectangle is given in the opengl frame coordinates (origin at bottom left). It is cached until the next render.
 		'''
-		if 'fb_ident' not in self.fresh:
+		area = (x, y, w, h)
+		if area not in self.fresh_areas:
+			self.renderident()
 			with self.scene.ctx as ctx:
 				ctx.finish()
 				self.makeCurrent()	# set the scene context as current opengl context
-				self.fb_ident.read_into(self.map_ident, viewport=self.fb_ident.viewport, components=2)
-				self.fb_ident.read_into(self.map_depth, viewport=self.fb_ident.viewport, components=1, attachment=-1, dtype='f4')
-			self.fresh.add('fb_ident')
-			#from PIL import Image
-			#Image.fromarray(self.map_ident*16, 'I;16').show()
+				ident = np.frombuffer(self.fb_ident.read(viewport=area, components=2), dtype='u2').reshape(h,w)
+				depth = np.frombuffer(self.fb_ident.read(viewport=area, components=1, attachment=-1, dtype='f4'), dtype='f4').reshape(h,w)
+			self.fresh_areas[area] = ident, depth
+		return self.fresh_areas[area]
+	
+	def readpixel(self, point: QPoint) -> '(ident, depth)':
+		''' load the ident and depth of the rendered frames at the given screen position '''
+		ident, depth = self.readmaps(point.x(), self.fb_ident.size[1]-1-point.y(), 1, 1)
+		return int(ident[0,0]), float(depth[0,0])
 	
 	def render(self):
 		# set the opengl current context from Qt (doing it only from moderngl interferes with Qt)
@@ -711,9 +775,17 @@ class View(QOpenGLWidget):
 		self.uniforms['proj'] = proj = self.projection.matrix(w/h, self.navigation.distance)
 		self.uniforms['projview'] = proj * view
 		self.fresh.clear()
+		self.fresh_areas.clear()
 		
-		# call the render stack
-		self.scene.render(self)
+		# call the render stack, the ident frame is only rendered when it is read
+		self.scene.render(self, [target  for target in self.targets  if target[0] != 'ident'])
+	
+	def renderident(self):
+		''' render the ident frame for the last rendered view, if not already done since the last render '''
+		if 'ident' not in self.fresh:
+			self.makeCurrent()
+			self.scene.render(self, [target  for target in self.targets  if target[0] == 'ident'])
+			self.fresh.add('ident')
 	
 	def identstep(self, nidents):
 		''' updates the amount of rendered idents and return the start ident for the calling rendering pass 
@@ -749,17 +821,15 @@ class View(QOpenGLWidget):
 		self.target.clear(*settings.display['background_color'])
 		
 	def preload(self):
-		''' internal method to load common ressources '''
-		ctx, ressources = self.scene.ctx, self.scene.ressources
-		ressources['shader_ident'] = ctx.program(
+		''' internal method to load common ressources, shared by all the views of the scene '''
+		self.scene.ressource('shader_ident', lambda scene: scene.ctx.program(
 					vertex_shader=open(ressourcedir+'/shaders/object-ident.vert').read(),
 					fragment_shader=open(ressourcedir+'/shaders/ident.frag').read(),
-					)
-
-		ressources['shader_subident'] = ctx.program(
+					))
+		self.scene.ressource('shader_subident', lambda scene: scene.ctx.program(
 					vertex_shader=open(ressourcedir+'/shaders/object-item-ident.vert').read(),
 					fragment_shader=open(ressourcedir+'/shaders/ident.frag').read(),
-					)
+					))
 
 		
 	# -- methods to deal with the view --
@@ -770,17 +840,26 @@ class View(QOpenGLWidget):
 		'''
 		if radius is None:	
 			radius = settings.controls['snap_dist']
-		self.refreshmaps()
-		for x,y in snailaround((point.x(), point.y()), (self.map_ident.shape[1], self.map_ident.shape[0]), radius):
-			ident = int(self.map_ident[-y, x])
-			if ident:
-				return QPoint(x,y)
+		mx, my = self.fb_ident.size
+		offsets = snailoffsets(radius)
+		xs = offsets[:,0] + point.x()
+		ys = offsets[:,1] + point.y()
+		inside = (0 <= xs) & (xs < mx) & (0 <= ys) & (ys < my)
+		xs, ys = xs[inside], ys[inside]
+		if not len(xs):	return None
+		# only read the square around the point
+		x0, x1 = int(xs.min()), int(xs.max())+1
+		y0, y1 = int(ys.min()), int(ys.max())+1
+		idents, _ = self.readmaps(x0, my-y1, x1-x0, y1-y0)
+		found = np.flatnonzero(idents[y1-1-ys, xs-x0])
+		if len(found):
+			i = found[0]
+			return QPoint(int(xs[i]), int(ys[i]))
 	
 	def ptat(self, point: QPoint) -> fvec3:
 		''' return the point of the rendered surfaces that match the given window coordinates '''
-		self.refreshmaps()
 		viewport = self.fb_ident.viewport
-		depthred = float(self.map_depth[-point.y(),point.x()])
+		_, depthred = self.readpixel(point)
 		x =  (point.x()/viewport[2] *2 -1)
 		y = -(point.y()/viewport[3] *2 -1)
 		
@@ -818,13 +897,11 @@ class View(QOpenGLWidget):
 		''' return the key path of the object at the given screen position (widget relative). 
 			If no object is at this exact location, None is returned  
 		'''
-		self.refreshmaps()
-		ident = int(self.map_ident[-point.y(), point.x()])
+		ident, _ = self.readpixel(point)
 		if ident:
-			rdri = bisect(self.steps, ident)
+			rdri = bisect_left(self.steps, ident)
 			if rdri == len(self.steps):
 				print('internal error: object ident points out of idents list')
-			while rdri > 0 and self.steps[rdri-1] == ident:	rdri -= 1
 			if rdri > 0:	subi = ident - self.steps[rdri-1] - 1
 			else:			subi = ident - 1
 			return (*self.scene.stacks['ident'][rdri][0], subi)
@@ -943,7 +1020,7 @@ class View(QOpenGLWidget):
 			# select what is under cursor
 			if type(disp).__name__ in ('SolidDisplay', 'WebDisplay'):
 				disp.vertices.selectsub(key[-1])
-				disp.selected = any(disp.vertices.flags & 0x1)
+				disp.selected = bool((disp.vertices.flags & 0x1).any())
 			else:
 				disp.selected = not disp.selected
 			# make sure that a display is selected if one of its sub displays is
@@ -986,22 +1063,41 @@ class View(QOpenGLWidget):
 
 def snail(radius):
 	''' generator of coordinates snailing around 0,0 '''
-	x = 0
-	y = 0
+	for x,y in snailtable(radius).tolist():
+		yield (x,y)
+
+@lru_cache(maxsize=8)
+def snailtable(radius):
+	''' array of the coordinates yielded by `snail`, in the same order '''
+	rings = [np.empty((0,2), dtype='i4')]
 	for r in range(radius):
-		for x in range(-r,r):		yield (x,-r)
-		for y in range(-r,r):		yield (r, y)
-		for x in reversed(range(-r,r)):	yield (x, r)
-		for y in reversed(range(-r,r)):	yield (-r,y)
+		side = np.arange(-r, r, dtype='i4')
+		back = side[::-1]
+		rings.append(np.stack([side, np.full(len(side), -r, dtype='i4')], axis=1))
+		rings.append(np.stack([np.full(len(side), r, dtype='i4'), side], axis=1))
+		rings.append(np.stack([back, np.full(len(side), r, dtype='i4')], axis=1))
+		rings.append(np.stack([np.full(len(side), -r, dtype='i4'), back], axis=1))
+	table = np.concatenate(rings)
+	table.flags.writeable = False
+	return table
+
+@lru_cache(maxsize=8)
+def snailoffsets(radius):
+	''' array of coordinates offsets snailing around 0,0 starting with 0,0 itself, up to the given radius (excluded) '''
+	offsets = np.concatenate([np.zeros((min(1, radius),2), dtype='i4'), snailtable(radius)])
+	offsets.flags.writeable = False
+	return offsets
 
 def snailaround(pt, box, radius):
 	''' generator of coordinates snailing around pt, coordinates that goes out of the box are skipped '''
 	cx,cy = pt
 	mx,my = box
-	for rx,ry in snail(radius):
-		x,y = cx+rx, cy+ry
-		if 0 <= x and x < mx and 0 <= y and y < my:
-			yield x,y
+	table = snailtable(radius)
+	xs = table[:,0] + cx
+	ys = table[:,1] + cy
+	inside = (0 <= xs) & (xs < mx) & (0 <= ys) & (ys < my)
+	for x,y in zip(xs[inside].tolist(), ys[inside].tolist()):
+		yield x,y
 
 
 '''
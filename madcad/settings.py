@@ -47,6 +47,7 @@ scene = {
 	'display_grid': True,
 	'display_annotations': True,
 	'surface_shading': True,
+	'frustum_culling': True,
 	
 	'debug_points': False,
 	'debug_faces': False,
@@ -1,12 +1,15 @@
 # This file is part of pymadcad,  distributed under license LGPL v3
 
 from math import inf
+import numpy as np
 from .mathutils import *
-from .mesh import Mesh, Web, Wire, MeshError, connpe, web
+from .mesh import Mesh, Web, Wire, MeshError, connpe, web, glmarray, indexarray
 from .asso import Asso
 from .nprint import nformat, nprint
 
 from operator import itemgetter
+from itertools import groupby
+from heapq import heapify, heappush, heappop
 
 
 class TriangulationError(Exception):	pass
@@ -26,7 +29,7 @@ def triangulation(outline, normal=None, prec=NUMPREC):
 
 def skeleting(outline: Wire, skeleting: callable, prec=NUMPREC) -> [vec2]:
 	''' skeleting procedure for the given wire
-		at each step, the skeleting function is called
+		at each step, the skeleting function is called with `(haxis, i, ip)` where `haxis[i-1]` and `haxis[i]` are the merged half axis, surrounded by their neighbours in `haxis`
 		created points will be added to the wire point buffer and this buffer is returned (ROI)
 		
 		NOTE: yet it only works with near-convex outlines
@@ -35,17 +38,26 @@ def skeleting(outline: Wire, skeleting: callable, prec=NUMPREC) -> [vec2]:
 	pts = outline.points
 	
 	# edge normals
-	enormals = [perp(normalize(outline[i]-outline[i-1]))	for i in range(l)]
+	coords = glmarray(list(outline), None)
+	diffs = coords - np.roll(coords, 1, axis=0)
+	diffs /= np.linalg.norm(diffs, axis=1, keepdims=True)
+	enormals = [vec2(-y, x)	for x,y in diffs[:,:2].tolist()]
 	# compute half axis starting from each point
 	haxis = []
 	for i in range(l):
 		haxis.append((outline.indices[i], i, (i+1)%l))
+	# neighbours of each remaining half axis
+	before = [(i-1)%l  for i in range(l)]
+	after = [(i+1)%l  for i in range(l)]
 	
 	# create the intersections to update
 	intersect = [(0,0)] * l	# intersection for each edge
 	dist = [-1] * l	# min distance for each edge
+	# heap of the closest intersections, an entry is outdated when its version doesn't match the axis' one
+	version = [0] * l
+	heap = []
 	def eval_intersect(i):
-		o1,a1,b1 = haxis[i-1]
+		o1,a1,b1 = haxis[before[i]]
 		o2,a2,b2 = haxis[i]
 		# compute normals to points
 		v1 = enormals[a1]+enormals[b1]
@@ -63,31 +75,31 @@ def skeleting(outline: Wire, skeleting: callable, prec=NUMPREC) -> [vec2]:
 		else:
 			intersect[i] = None
 			dist[i] = inf
+		version[i] += 1
+		heappush(heap, (dist[i], i, version[i]))
 	for i in range(l):
 		eval_intersect(i)
 	
 	# build skeleton
-	while len(haxis) > 1:
-		print(dist)
-		i = min(range(len(haxis)), key=lambda i:dist[i])
-		assert dist[i] != inf, "no more intersection found (algorithm failure)"
-		o1,a1,b1 = haxis[i-1]
+	remaining = l
+	while remaining > 1:
+		d, i, v = heappop(heap)
+		if v != version[i]:	continue
+		assert d != inf, "no more intersection found (algorithm failure)"
+		h = before[i]
+		o1,a1,b1 = haxis[h]
 		o2,a2,b2 = haxis[i]
 		# add the intersection point
 		ip = len(pts)
 		pts.append(intersect[i])
 		# extend skeleton
-		skeleting(haxis, i, ip)
+		skeleting([haxis[before[h]], haxis[h], haxis[i], haxis[after[i]]], 2, ip)
 		# create the new half axis
-		haxis.pop(i)
-		dist.pop(i)
-		intersect.pop(i)
-		haxis[i-1] = (ip, a1, b2)
-		eval_intersect((i-2) % len(haxis))
-		eval_intersect((i-1) % len(haxis))
-		eval_intersect(i % len(haxis))
-		eval_intersect((i+1) % len(haxis))
-		eval_intersect((i+2) % len(haxis))
+		after[h], before[after[i]] = after[i], h
+		remaining -= 1
+		haxis[h] = (ip, a1, b2)
+		eval_intersect(h)
+		eval_intersect(after[h])
 	
 	return pts
 
@@ -139,18 +151,23 @@ def triangulation_skeleton(outline: Wire, prec=NUMPREC) -> Mesh:
 	m = Mesh(pts, triangles)
 	# merge points from short internal edges
 	minbone = 0.5*minbone[0]
-	merges = {}
+	parent = list(range(len(pts)))
+	def find(x):
+		root = x
+		while parent[root] != root:	root = parent[root]
+		while parent[x] != root:	parent[x], x = root, parent[x]
+		return root
 	for a,b in skeleton:
 		if distance(pts[a], pts[b]) < minbone:
-			if   a not in merges:	merges[a] = merges.get(b,b)
-			elif b not in merges:	merges[b] = merges.get(a,a)
-	for k,v in merges.items():
-		while v in merges and merges[v] != v:	
-			if distance(pts[k], pts[v]) > minbone:
-				merges[k] = k
-				merges[v] = v
-				break
-			merges[k] = v = merges[v]
+			a, b = find(a), find(b)
+			if   a < b:	parent[b] = a
+			elif b < a:	parent[a] = b
+	merges = {}
+	for k in range(original, len(pts)):
+		r = find(k)
+		# a point is not moved farther than the merge distance
+		if r != k and distance(pts[k], pts[r]) <= minbone:
+			merges[k] = r
 	m.mergepoints(merges)
 	return m
 
@@ -159,76 +176,14 @@ def triangulation_skeleton(outline: Wire, prec=NUMPREC) -> Mesh:
 '''
 	triangulation outline
 	triangulation using only points from the given outline, creating quite good triangles at cost of efficiency
-	O(n**2)
+	O(n*(k + log(n)))
 '''
 
-def triangulation_outline(outline: Wire, normal=None) -> Mesh:
-	''' return a mesh with the triangles formed in the outline
-		the returned mesh uses the same buffer of points than the input
-		
-		complexity:  O(n**2) mat2 operations
-	'''
-	# get a normal in the right direction for loop winding
-	if not normal:		normal = outline.normal()
-	try:				proj = planeproject(outline, normal)
-	except ValueError:	return Mesh()
-	hole = list(outline.indices)
-	if length2(outline[-1]-outline[0]) < 4*NUMPREC**2:		hole.pop()
-	
-	def priority(u,v):
-		''' priority criterion for 2D triangles, depending on its shape
-		'''
-		uv = length(u)*length(v)
-		if not uv:	return 0
-		return dot(u,v) / uv
-	
-	def score(i):
-		l = len(hole)
-		u = proj[(i+1)%l] - proj[i]
-		v = proj[(i-1)%l] - proj[i]
-		triangle = (hole[(i-1)%l], hole[i], hole[(i+1)%l])
-		
-		if triangle[0] == triangle[1] or triangle[1] == triangle[2]:	return 0
-		if perpdot(u,v) < -NUMPREC:		return -inf
-		sc = priority(u,v)
-		if perpdot(u,v) > NUMPREC:
-			# check that there is not point of the outline inside the triangle
-			decomp = inverse(dmat2(u,v))
-			o = proj[i]
-			for j in range(l):
-				if hole[j] not in triangle:
-					p = proj[j]
-					uc,vc = decomp * dvec2(p-o)
-					if 0 <= uc and 0 <= vc and uc+vc <= 1:
-						sc = -inf
-						break
-		return sc
-	scores = [score(i) for i in range(len(hole))]
-	
-	triangles = []
-	while len(hole) > 2:
-		l = len(hole)
-		i = max(range(l), key=lambda i:scores[i])
-		if scores[i] == -inf:
-			raise TriangulationError("no more feasible triangles (algorithm failure or bad input outline)", hole)
-			#print('warning: no more feasible triangles', hole)
-			#break
-		triangles.append((hole[(i-1)%l], hole[i], hole[(i+1)%l]))
-		hole.pop(i)
-		proj.pop(i)
-		scores.pop(i)
-		l -= 1
-		scores[(i-1)%l] = score((i-1)%l)
-		scores[i%l] = score(i%l)
-	
-	return Mesh(outline.points, triangles)
-
-
 def triangulation_outline(outline: Wire, normal=None, prec=None) -> Mesh:
 	''' return a mesh with the triangles formed in the outline
 		the returned mesh uses the same buffer of points than the input
 		
-		complexity:  O(n*k)  where k is the number of non convex points
+		complexity:  O(n*(k + log(n)))  where k is the number of non convex points
 	'''
 	# get a normal in the right direction for loop winding
 	if not normal:		normal = outline.normal()
@@ -239,6 +194,12 @@ def triangulation_outline(outline: Wire, normal=None, prec=None) -> Mesh:
 	# reducing contour, indexing proj and outlines.indices
 	hole = list(range(len(outline.indices)))
 	if length2(outline[-1]-outline[0]) < prec:		hole.pop()
+	# neighbours of each point in the reducing contour
+	before = [i-1  for i in hole]
+	after = [i+1  for i in hole]
+	if hole:
+		before[0] = hole[-1]
+		after[-1] = hole[0]
 	# set of remaining non-convexity points, indexing proj
 	l = len(outline.indices)
 	nonconvex = { i
@@ -254,55 +215,73 @@ def triangulation_outline(outline: Wire, normal=None, prec=None) -> Mesh:
 		return dot(u,v) / uv
 	
 	def score(i):
-		l = len(hole)
-		o = proj[hole[ i ]]
-		u = proj[hole[ (i+1)%l ]] - o
-		v = proj[hole[ (i-1)%l ]] - o
-		triangle = (hole[(i-1)%l], hole[i], hole[(i+1)%l])
+		o = proj[i]
+		u = proj[after[i]] - o
+		v = proj[before[i]] - o
+		triangle = (before[i], i, after[i])
 		
 		# check for badly oriented triangle
 		if perpdot(u,v) < -prec:		return -inf
 		# check for intersection with the rest
 		if perpdot(u,v) > prec:
 			# check that there is not point of the outline inside the triangle
+			corners = [proj[k]  for k in triangle]
+			sides = [(corners[k], corners[k]-corners[k-1])  for k in range(3)]
+			low = glm.min(glm.min(corners[0], corners[1]), corners[2])
+			high = glm.max(glm.max(corners[0], corners[1]), corners[2])
 			for j in nonconvex:
 				if j not in triangle:
-					for k in range(3):
-						o = proj[triangle[k]]
-						if perpdot(o-proj[triangle[k-1]], proj[j]-o) <= prec:
+					p = proj[j]
+					# points out of the triangle's box cannot be inside
+					if p.x < low.x or p.y < low.y or p.x > high.x or p.y > high.y:
+						continue
+					for o, side in sides:
+						if perpdot(side, p-o) <= prec:
 							break
 					else:
 						return -inf
 		return priority(u,v)
-	scores = [score(i) for i in range(len(hole))]
+	# heap of the best ears, ties go to the last point in the contour
+	# an entry is outdated when its version doesn't match the point's one
+	version = [0] * len(hole)
+	heap = [(-score(i), -i, 0)  for i in hole]
+	heapify(heap)
 	
 	triangles = []
-	while len(hole) > 2:
-		l = len(hole)
-		i = imax(scores)
-		if scores[i] == -inf:
-			raise TriangulationError("no more feasible triangles (algorithm failure or bad input outline)", [outline.indices[i] for i in hole])
+	remaining = len(hole)
+	while remaining > 2:
+		sc, i, v = heappop(heap)
+		i = -i
+		if v != version[i]:	continue
+		if sc == inf:
+			left = [i]
+			while after[left[-1]] != i:	left.append(after[left[-1]])
+			raise TriangulationError("no more feasible triangles (algorithm failure or bad input outline)", [outline.indices[j] for j in sorted(left)])
+		a, b = before[i], after[i]
 		triangles.append((
-			outline.indices[hole[(i-1)%l]], 
-			outline.indices[hole[i]], 
-			outline.indices[hole[(i+1)%l]],
+			outline.indices[a], 
+			outline.indices[i], 
+			outline.indices[b],
 			))
-		nonconvex.discard(hole.pop(i))
-		scores.pop(i)
-		l -= 1
-		scores[(i-1)%l] = score((i-1)%l)
-		scores[i%l] = score(i%l)
+		nonconvex.discard(i)
+		after[a], before[b] = b, a
+		remaining -= 1
+		for j in (a, b):
+			version[j] += 1
+			heappush(heap, (-score(j), -j, version[j]))
 	
 	return Mesh(outline.points, triangles)
 
 def planeproject(pts, normal=None):
 	''' project an outline in a plane, to get its points as vec2 '''
 	x,y,z = guessbase(pts, normal)
-	i = min(range(len(pts)), key=lambda i: dot(pts[i],x))
+	# project all points at once
+	proj = glmarray(list(pts), None) @ np.array([tuple(x), tuple(y)]).transpose()
+	i = int(np.argmin(proj[:,0]))
 	l = len(pts)
 	if dot(z, cross(pts[(i+1)%l]-pts[i], pts[(i-1)%l]-pts[i])) < 0:
-		y = -y
-	return [vec2(dot(p,x), dot(p,y))	for p in pts]
+		proj[:,1] = -proj[:,1]
+	return [vec2(*p)	for p in proj.tolist()]
 
 def guessbase(pts, normal=None, thres=10*NUMPREC):
 	''' build a base in which the points will be in plane XY 
@@ -364,29 +343,37 @@ def sweepline_loops(lines: Web, normal=None):
 	x,y,z = guessbase(lines.points, normal)
 	#debprint('sortdim', x, 'y', y)
 	# projection of the lines points on x and y
-	pts = {}
-	for e in lines.edges:
-		for i in e:
-			if i not in pts:
-				p = lines.points[i]
-				pts[i] = vec2(dot(p,x), dot(p,y))
+	used = np.unique(indexarray(lines.edges, 2)).tolist()
+	proj = glmarray([lines.points[i]  for i in used], None) @ np.array([tuple(x), tuple(y)]).transpose()
+	pts = dict(zip(used, [vec2(*p)  for p in proj.tolist()]))
 	
 	#debprint('sweepline')
 	#debprint('\npoints = {},\nedges = {},\n'.format(lines.points, lines.edges))
 	
-	# affine function y = a*x + b   for edges
+	# affine function y = a*x + b   for edges, cached for each edge orientation
+	affines = {}
 	def affiney(e, x):
-		a, b = pts[e[0]], pts[e[1]]
-		v = b-a
-		if v[0]:	d = v[1]/v[0]
-		elif v[1] > 0:	d = -inf
-		else:			d = inf
-		return a[1] + d * (x - a[0])
+		if e not in affines:
+			a, b = pts[e[0]], pts[e[1]]
+			v = b-a
+			if v[0]:	d = v[1]/v[0]
+			elif v[1] > 0:	d = -inf
+			else:			d = inf
+			affines[e] = (a[0], a[1], d)
+		x0, y0, d = affines[e]
+		return y0 + d * (x - x0)
 	
 	def orthoproj(v):
 		l = length(v)
 		return v[1] / l if l else 0
 	
+	# orthoproj of the edges directions, cached for each edge orientation
+	slopes = {}
+	def slope(e):
+		if e not in slopes:
+			slopes[e] = orthoproj(pts[e[1]]-pts[e[0]])
+		return slopes[e]
+	
 	# orient edges along the axis and sort them
 	# sorting is done using absciss and orientation in case of similar absciss
 	# the nearest directions to +-y is prefered to speedup cluster distinction
@@ -394,21 +381,27 @@ def sweepline_loops(lines: Web, normal=None):
 	for i,(a,b) in enumerate(edges):
 		if pts[a][0] < pts[b][0]:	edges[i] = b,a
 	stack = sorted(edges,
-				key=lambda e: (pts[e[0]][0], abs(orthoproj(pts[e[1]]-pts[e[0]])) )
+				key=lambda e: (pts[e[0]][0], abs(slope(e)) )
 				)
 	
 	# remove absciss ambiguity (for edges that share points with the same absciss)
 	# for each edge, all following edges with the same absciss and contains its start point will have the same startpoint
-	for i in reversed(range(len(stack))):
-		l = stack[i][0]
-		n = i-1
-		for j in reversed(range(i)):
-			if pts[stack[j][0]][0] < pts[l][0]:	break
-			if stack[j][1] == l:	
-				stack[j] = (stack[j][1], stack[j][0])
-			if stack[j][0] == l:
-				if n != j:	stack.insert(n, stack.pop(j))
-				n -= 1
+	# and are gathered just before it. This only involves the edges starting at the same absciss
+	grouped = []
+	for _, group in groupby(stack, key=lambda e: pts[e[0]][0]):
+		group = list(group)
+		i = len(group)-1
+		while i > 0:
+			l = group[i][0]
+			before = group[:i]
+			for j,e in enumerate(before):
+				if e[1] == l:	before[j] = (e[1], e[0])
+			group[:i] = [e for e in before if e[0] != l] + [e for e in before if e[0] == l]
+			# the gathered edges start at the same point, they have nothing left to gather
+			i -= 1
+			while i > 0 and group[i][0] == l:	i -= 1
+		grouped.extend(group)
+	stack = grouped
 	#debprint('stack', stack)
 	#debprint('stack')
 	#for e in stack:
@@ -427,10 +420,11 @@ def sweepline_loops(lines: Web, normal=None):
 		m = None
 		sc = -1
 		i = len(stack)-1
-		while i >= 0 and pts[stack[i][0]][0] == pts[edge[0]][0]:
+		edgeslope = slope(edge)
+		while i >= 0 and pts[stack[i][0]][0] == p0[0]:
 			e = stack[i]
 			if e[0] == edge[0]:
-				diff = abs(orthoproj(pts[e[1]]-pts[e[0]]) - orthoproj(pts[edge[1]]-pts[edge[0]]))
+				diff = abs(slope(e) - edgeslope)
 				if diff > sc:	
 					sc = diff
 					m = i
@@ -438,7 +432,7 @@ def sweepline_loops(lines: Web, normal=None):
 		if m is not None:	
 			# edge must be above coedge
 			coedge = stack.pop(m)
-			if orthoproj(pts[edge[1]]-pts[edge[0]]) < orthoproj(pts[coedge[1]]-pts[coedge[0]]):
+			if edgeslope < slope(coedge):
 				edge, coedge = coedge, edge
 		else:
 			coedge = None
@@ -524,11 +518,12 @@ def sweepline_loops(lines: Web, normal=None):
 			# if it's a new corner, create a cluster
 			if coedge and edge[1] != coedge[1]:
 				p0 = pts[edge[0]]
-				# find the place to insert the cluster
-				# NOTE a dichotomy is more efficient, but for now ...
-				j = 0
-				while j < len(clusters) and affiney(clusters[j][1], p0[0]) > p0[1]:
-					j += 1
+				# find the place to insert the cluster, by dichotomy since clusters are in descending order on y
+				j, end = 0, len(clusters)
+				while j < end:
+					mid = (j+end)//2
+					if affiney(clusters[mid][1], p0[0]) > p0[1]:	j = mid+1
+					else:											end = mid
 				clusters.insert(j, (coedge, edge))
 				loops.insert(j, [edge[0]])
 				#debprint('    new cluster', j)
@@ -571,83 +566,6 @@ def triangulation_sweepline(outline: Web, normal=None, prec=0) -> Mesh:
 	loop holes briding based on the distance to the other holes
 '''
 
-def line_bridges(lines: Web, conn=None):
-	''' find what edges to insert in the given mesh to make all its loops connex.
-		returns a Web of the bridging edges.
-		
-		complexity: O(n**2 * n/k)
-		with
-			n = number of points in the lines
-			k = average number of points per loop
-			
-		could easily be improved to  O(n**2 + n*k)
-	'''
-	if conn is None:	conn = connpe(lines.edges)
-	pts = lines.points
-	
-	bridges = []	# edges created
-	# reached and remaining parts, both as edge indices and point indices
-	reached_points = set()
-	reached_edges = set()
-	remain_points = set(p 	 for e in lines.edges for p in e)
-	remain_edges = set(range(len(lines.edges)))
-	
-	def propagate(start):
-		''' propagate from the given start point to make connex points and edges as reached '''
-		front = [start]
-		while front:
-			s = front.pop()
-			if s in reached_points:	continue
-			reached_points.add(s)
-			remain_points.discard(s)
-			for e in conn[s]:
-				reached_edges.add(e)
-				remain_edges.discard(e)
-				front.extend(lines.edges[e])
-	
-	def find_closest():
-		''' find the next edge to create, 
-			so with the closest remaining element to the reached ones
-			distance is edge to edge
-		'''
-		best = None
-		score = inf
-		# minimum from edges to points
-		for ac in reached_edges:
-			ep = lines.edgepoints(ac)
-			for ma in remain_points:
-				d = distance_pe(pts[ma], ep)
-				if d < score:
-					e = lines.edges[ac]
-					if distance2(pts[ma], pts[e[0]]) < distance2(pts[ma], pts[e[1]]):
-						score, best = d, (ma, e[0])
-					else:
-						score, best = d, (ma, e[1])
-		# minimum from points to edges
-		for ma in remain_edges:
-			ep = lines.edgepoints(ma)
-			for ac in reached_points:
-				d = distance_pe(pts[ac], ep)
-				if d < score:
-					e = lines.edges[ma]
-					if distance2(pts[ac], pts[e[0]]) < distance2(pts[ac], pts[e[1]]):
-						score, best = d, (e[0], ac)
-					else:
-						score, best = d, (e[1], ac)
-						
-		return best
-	
-	# main loop
-	propagate(lines.edges[0][0])
-	while True:
-		closest = find_closest()
-		if not closest:	break
-		bridges.append(closest)
-		bridges.append(tuple(reversed(closest)))
-		propagate(closest[0])
-		
-	return Web(lines.points, bridges)
-	
 def line_bridges(lines: Web, conn=None) -> 'Web':
 	''' find what edges to insert in the given mesh to make all its loops connex.
 		returns a Web of the bridging edges.
@@ -825,9 +743,7 @@ def vmaxi(v):
 
 def vsorti(v):
 	''' coordinates sort indices for a vec3, decreasing order'''
-	i = 0
-	if v[1] > v[i]:	i = 1
-	if v[2] > v[i]:	i = 2
+	i = vmaxi(v)
 	if v[(i+1)%3] > v[(i-1)%3]:		j,k = (i+1)%3, (i-1)%3
 	else:							j,k = (i-1)%3, (i+1)%3
 	return (i,j,k)
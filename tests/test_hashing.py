@@ -35,4 +35,26 @@ print(set( m.get((vec3(8,0,0),vec3(0,8,0),vec3(-2,-2,8))) ))
 
 m.options['color'] = (0.7, 0.9, 1)
 
+# a frozen map finds the same objects
+f = PositionMap(1, [(vec3(.5), 'a')])
+segment = (vec3(.5,.5,5.5), vec3(.5))
+assert list(f.get(segment)) == ['a']
+f.freeze()
+assert list(f.get(segment)) == ['a']
+# merging from a frozen map
+g = PositionMap(1, [(vec3(.5,.5,3.5), 'b')])
+g.update(f)
+assert sorted(g.get(segment)) == ['a', 'b']
+
+# merging by arrays gives the same result as inserting in a PointSet
+from random import random
+import numpy as np
+pts = [vec3(random(), random(), random())	for i in range(1000)]
+pts += [p + vec3(random(), random(), random())*0.01	for p in pts[:500]]
+s = PointSet(0.01)
+indices = [s.add(p)	for p in pts]
+merges = pointmerges(np.array([tuple(p) for p in pts]), 0.01)
+assert [indices[i] for i in merges] == indices
+assert (merges[merges] == merges).all()
+
 show([m, triangles, lines])
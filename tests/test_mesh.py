@@ -1,6 +1,7 @@
 from random import random
 from madcad import *
 from madcad.mesh import *
+from madcad.mesh import facekeyo
 from madcad.nprint import nprint
 
 
@@ -27,10 +28,30 @@ l[1].check()
 # test frontiers
 m = bri.frontiers(0,2,3)
 assert {e:m.groups[m.tracks[i]]	for i,e in enumerate(m.edges)} == {(0,1):(0,2), (1,5):(2,3), (1,2):(0,3)}
+# test group outlines
+m = Mesh([vec3(0), vec3(1,0,0), vec3(1,1,0), vec3(0,1,0)], [(0,1,2), (0,2,3)], [0,1], [None, None]).groupoutlines()
+assert list(zip(m.edges, m.tracks)) == [((2,0),1), ((0,1),0), ((1,2),0), ((2,3),1), ((3,0),1)]
+
+# test outlines, an edge shared by more than 2 faces depends on the face order
+m = Mesh([vec3(i) for i in range(6)], [(0,1,2), (0,1,4), (1,0,5), (1,0,4)])
+assert m.outlines_oriented() == {(0,1), (0,2), (2,1), (1,5), (5,0)}
+
+# test face keys, all rotations of an oriented face give the same key
+assert {facekeyo(*f)	for f in [(1,3,2), (3,2,1), (2,1,3)]} == {(1,3,2)}
+assert {facekeyo(*f)	for f in [(1,2,3), (2,3,1), (3,1,2)]} == {(1,2,3)}
 
 # test transform
 m = Mesh([vec3(0,0,0), vec3(1,0,0), vec3(0,1,0)], [(0,1,2)]).transform(vec3(0,0,-5))
 m.check()
+t = translate(rotate(mat4(1), 1, vec3(1,2,3)), vec3(1,-2,4))
+assert all(distance(a, vec3(t*vec4(b,1))) < 1e-9	for a,b in zip(m.transform(t).points, m.points))
+# test surface and barycenter
+assert abs(m.surface() - 0.5) < 1e-9
+assert distance(m.barycenter(), vec3(1/3, 1/3, -5)) < 1e-9
+# test group selection
+m2 = Mesh([vec3(0,0,0), vec3(1,0,0), vec3(0,1,0), vec3(0,0,1), vec3(1,0,1), vec3(0,1,1)], [(0,1,2), (3,4,5)], [0,1], [None, None])
+assert m2.groupnear(vec3(0.2,0.2,0.1)) == 0
+assert m2.groupnear(vec3(0.2,0.2,0.9)) == 1
 # test distance
 assert abs(mesh_distance(m, ico)[0] - 4) < 0.2
 
@@ -55,4 +76,16 @@ m = Web(
 m.check()
 assert len(m.islands()) == 2
 
+# test merge
+m = Web([vec3(0), vec3(1,0,0), vec3(1,0,0), vec3(2,1,0)], [(0,1), (1,2), (2,3)])
+m.mergeclose()
+m.check()
+assert m.edges == [(0,1), (1,2)] and m.tracks == [0, 0]
+
+
 
+# test length
+m = Web([vec3(0), vec3(1,0,0), vec3(1,2,0)], [(0,1), (1,2)])
+assert abs(m.length() - 3) < 1e-9
+m = Wire([vec3(0), vec3(1,0,0), vec3(1,2,0)])
+assert abs(m.length() - 3) < 1e-9